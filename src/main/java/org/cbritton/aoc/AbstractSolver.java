@@ -2,7 +2,9 @@ package org.cbritton.aoc;
 
 import java.io.*;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.List;
+import java.util.Locale;
 
 public abstract class AbstractSolver {
 
@@ -47,6 +49,54 @@ public abstract class AbstractSolver {
         return;
     }
 
+    // One line of JSON in the same shape as the Python benchmark records.
+    public String benchmark(int part, String dataFilePath, int repeat, int warmup) {
+        double[] parseTimes = new double[repeat];
+        double[] solveTimes = new double[repeat];
+        Object answer = null;
+        for (int i = -warmup; i < repeat; ++i) {
+            Timer parseTimer = new Timer();
+            Object data = this.initData(dataFilePath);
+            parseTimer.stop();
+            Timer solveTimer = new Timer();
+            answer = (1 == part) ? this.solvePart1(data) : this.solvePart2(data);
+            solveTimer.stop();
+            if (i >= 0) {
+                parseTimes[i] = parseTimer.elapsedSeconds();
+                solveTimes[i] = solveTimer.elapsedSeconds();
+            }
+        }
+        return String.format(Locale.ROOT,
+                "{\"day\": \"%02d\", \"part\": %d, \"answer\": \"%s\", \"implementation\": \"Java\", "
+                        + "\"version\": \"%s\", \"warmup\": %d, \"parse\": %s, \"solve\": %s}",
+                this.getDay(), part, answer, System.getProperty("java.version"), warmup,
+                timingStats(parseTimes), timingStats(solveTimes));
+    }
+
+    // Same statistics as the Python TimingStats.from_samples.
+    protected static String timingStats(double[] samples) {
+        double[] sorted = samples.clone();
+        Arrays.sort(sorted);
+        int n = sorted.length;
+        double median = (1 == n % 2) ? sorted[n / 2] : (sorted[n / 2 - 1] + sorted[n / 2]) / 2;
+        double p95 = sorted[0];
+        double stddev = 0.0;
+        if (n > 1) {
+            int j = 19 * (n - 1) / 20;
+            int delta = 19 * (n - 1) - j * 20;
+            p95 = (sorted[j] * (20 - delta) + sorted[j + 1] * delta) / 20;
+            double mean = Arrays.stream(sorted).average().orElse(0.0);
+            double sum = 0.0;
+            for (double sample : sorted) {
+                sum += (sample - mean) * (sample - mean);
+            }
+            stddev = Math.sqrt(sum / (n - 1));
+        }
+        return String.format(Locale.ROOT,
+                "{\"count\": %d, \"min\": %.9e, \"median\": %.9e, \"p95\": %.9e, \"stddev\": %.9e}",
+                n, sorted[0], median, p95, stddev);
+    }
+
     protected void printInfo(String part, Timer timer, Object answer) {
         System.out.printf("%s\n    Elapsed Time: %s\n          Answer: %s%n", part, timer.elapsedTime(), answer);
     }
@@ -12,6 +12,14 @@ public class Timer {
     public void stop() {
         this.endTime = System.nanoTime();
     }
+
+    public double elapsedSeconds() {
+        if (0 == this.endTime) {
+            this.stop();
+        }
+        return (this.endTime - this.startTime) / 1e9;
+    }
+
     public String elapsedTime() {
         if (0 == this.endTime) {
             this.stop();
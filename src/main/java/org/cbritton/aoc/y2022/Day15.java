@@ -4,7 +4,10 @@ import org.cbritton.aoc.AbstractSolver;
 
 import java.util.ArrayList;
 import java.util.Collections;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
+import java.util.TreeSet;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -49,23 +52,17 @@ public class Day15 extends AbstractSolver {
     }
 
     private boolean nextExtendsCurrent(Interval currentInterval, Interval nextInterval) {
-        return nextInterval.start <= currentInterval.end && currentInterval.end <= nextInterval.end;
+        return nextInterval.start <= currentInterval.end + 1 && currentInterval.end + 1 <= nextInterval.end;
     }
 
-    @Override
-    public Object solvePart1(Object data) {
-        List<Sensor> sensors = (List<Sensor>) data;
-        List<Interval> excludedXIntervals = new ArrayList<>();
-        for (Sensor sensor : sensors) {
-            Interval interval = sensor.excludedXInterval(this.row);
-            if (null != interval) {
-                excludedXIntervals.add(interval);
-            }
-        }
+    private List<Interval> collapseIntervals(List<Interval> intervals) {
         List<Interval> collapsedIntervals = new ArrayList<>();
-        Collections.sort(excludedXIntervals);
-        Interval currentInterval = excludedXIntervals.get(0);
-        for (Interval nextInterval : excludedXIntervals.subList(1, excludedXIntervals.size())) {
+        if (intervals.isEmpty()) {
+            return collapsedIntervals;
+        }
+        Collections.sort(intervals);
+        Interval currentInterval = intervals.get(0);
+        for (Interval nextInterval : intervals.subList(1, intervals.size())) {
             if (this.currentContainsNext(currentInterval, nextInterval)) {
                 continue;
             } else if (this.nextContainsCurrent(currentInterval, nextInterval)) {
@@ -79,22 +76,102 @@ public class Day15 extends AbstractSolver {
             }
         }
         collapsedIntervals.add(currentInterval);
-        return collapsedIntervals.stream().reduce(0, (a, b) -> a + (b.end - b.start), Integer::sum);
+        return collapsedIntervals;
+    }
+
+    @Override
+    public Object solvePart1(Object data) {
+        List<Sensor> sensors = (List<Sensor>) data;
+        List<Interval> excludedXIntervals = new ArrayList<>();
+        for (Sensor sensor : sensors) {
+            Interval interval = sensor.excludedXInterval(this.row);
+            if (null != interval) {
+                excludedXIntervals.add(interval);
+            }
+        }
+        List<Interval> collapsedIntervals = this.collapseIntervals(excludedXIntervals);
+        int covered = 0;
+        for (Interval interval : collapsedIntervals) {
+            covered += interval.end - interval.start + 1;
+        }
+        // A position with a beacon on it can still hold a beacon.
+        Set<Integer> beaconXs = new HashSet<>();
+        for (Sensor sensor : sensors) {
+            Point location = sensor.beacon.location;
+            if (location.y == this.row && this.isCovered(collapsedIntervals, location.x)) {
+                beaconXs.add(location.x);
+            }
+        }
+        return covered - beaconXs.size();
+    }
+
+    private boolean isCovered(List<Interval> intervals, int x) {
+        for (Interval interval : intervals) {
+            if (interval.start <= x && x <= interval.end) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    private Integer findGap(List<Interval> intervals, int low, int high, int parity) {
+        int candidate = low + Math.floorMod(low - parity, 2);
+        for (Interval interval : intervals) {
+            if (candidate < interval.start) {
+                break;
+            }
+            if (candidate <= interval.end) {
+                candidate = interval.end + 1 + Math.floorMod(interval.end + 1 - parity, 2);
+            }
+        }
+        return (candidate <= high) ? candidate : null;
+    }
+
+    private Point findUncoveredOnLine(List<int[]> squares, int axis, int value) {
+        int other = 1 - axis;
+        List<Interval> covered = new ArrayList<>();
+        for (int[] square : squares) {
+            if (Math.abs(value - square[axis]) <= square[2]) {
+                covered.add(new Interval(square[other] - square[2], square[other] + square[2]));
+            }
+        }
+        int m = this.max_xy;
+        int low = (0 == axis) ? Math.max(-value, value - 2 * m) : Math.max(-value, value);
+        int high = (0 == axis) ? Math.min(value, 2 * m - value) : Math.min(2 * m - value, 2 * m + value);
+        Integer otherValue = this.findGap(this.collapseIntervals(covered), low, high, Math.floorMod(value, 2));
+        if (null == otherValue) {
+            return null;
+        }
+        int a = (0 == axis) ? value : otherValue;
+        int b = (0 == axis) ? otherValue : value;
+        return new Point((a + b) / 2, (a - b) / 2);
     }
 
     @Override
     public Object solvePart2(Object data) {
+        // Same search as the Python solver: with a = x + y and b = x - y each
+        // sensor covers a square, and the uncovered position lies on a line
+        // just outside one of the squares.
         List<Sensor> sensors = (List<Sensor>) data;
-        for (int y = 0; y <= this.max_xy; ++y) {
-            System.out.printf("y=%d\t%d%n", y, System.currentTimeMillis());
-            for (int x = 0; x <= this.max_xy; ++x) {
-                Point p = new Point(x, y);
-                if (sensors.stream().noneMatch(a -> a.isInExclusionZone(p))) {
-                    return (p.x * 4000000) + p.y;
+        List<int[]> squares = new ArrayList<>();
+        for (Sensor sensor : sensors) {
+            squares.add(new int[]{sensor.location.x + sensor.location.y, sensor.location.x - sensor.location.y,
+                    sensor.beaconDistance()});
+        }
+        for (int axis = 0; axis < 2; ++axis) {
+            TreeSet<Integer> lines = new TreeSet<>();
+            for (int[] square : squares) {
+                lines.add(square[axis] - square[2] - 1);
+                lines.add(square[axis] + square[2] + 1);
+            }
+            for (int value : lines) {
+                Point p = this.findUncoveredOnLine(squares, axis, value);
+                if (null != p) {
+                    return ((long) p.x * 4000000L) + p.y;
                 }
             }
         }
-        return 0;
+        throw new RuntimeException("Every position in the search area is covered");
     }
 
     @Override
@@ -102,9 +179,22 @@ public class Day15 extends AbstractSolver {
         return Integer.parseInt(getClass().getSimpleName().substring(3));
     }
 
+    // With arguments <data file> <repeat> <warmup> [<row> <max xy>], print a
+    // benchmark record for each part instead of solving once.
     public static void main(String[] argv) {
         Day15 solver = new Day15();
-        solver.run();
+        if (0 == argv.length) {
+            solver.run();
+            return;
+        }
+        int repeat = Integer.parseInt(argv[1]);
+        int warmup = Integer.parseInt(argv[2]);
+        if (argv.length > 4) {
+            solver.row = Integer.parseInt(argv[3]);
+            solver.max_xy = Integer.parseInt(argv[4]);
+        }
+        System.out.println(solver.benchmark(1, argv[0], repeat, warmup));
+        System.out.println(solver.benchmark(2, argv[0], repeat, warmup));
     }
 
 
@@ -0,0 +1,331 @@
+"""
+On-disk caches keyed by content hashes.
+
+Keys combine a hash of the puzzle data with a hash of the solver source
+and of every module in this package that the solver imports, so editing
+any of them makes old entries unreachable. Both caches evict their least
+recently used entries once they grow past a size limit, so unreachable
+entries age out on their own.
+"""
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import tempfile
+from functools import cache
+from typing import Any, Iterator
+
+from src.main.python.registry import PACKAGE
+from src.main.python.util import AbstractSolver, file_digest
+
+DEFAULT_PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_ANSWER_CACHE_MAX_BYTES = 1024 * 1024
+
+
+def imported_modules(tree: ast.Module) -> Iterator[str]:
+    """
+    Find the names of the modules in this package that a module imports,
+    including imports inside functions and TYPE_CHECKING blocks.
+
+    Args:
+        tree: The parsed source of the module.
+
+    Returns:
+        The names of the imported modules, and of names imported from them
+        that may be modules themselves.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module] + [f'{node.module}.{alias.name}'
+                                     for alias in node.names]
+        else:
+            continue
+        yield from (name for name in names if name.startswith(PACKAGE))
+
+
+def find_source_file(module_name: str) -> str | None:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ModuleNotFoundError:
+        return None
+    if spec is None or not (spec.origin or '').endswith('.py'):
+        return None
+    return spec.origin
+
+
+@cache
+def source_files(module_name: str) -> tuple[str, ...]:
+    """
+    Find the source files of a module and of every module in this package
+    that it imports, directly or indirectly.
+
+    Args:
+        module_name: The name of the module.
+
+    Returns:
+        The paths of the source files, sorted.
+    """
+    files = dict()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        if name in files:
+            continue
+        files[name] = find_source_file(name)
+        if files[name] is not None:
+            with open(files[name], 'r') as source_file:
+                tree = ast.parse(source_file.read(), files[name])
+            pending.extend(imported_modules(tree))
+    return tuple(sorted(path for path in files.values() if path))
+
+
+def solver_version(solver: AbstractSolver) -> str:
+    """
+    Hash the source of every module in this package that defines the solver
+    class or one of its base classes, or that one of those modules imports.
+
+    Args:
+        solver: The solver.
+
+    Returns:
+        The hex SHA-256 digest of the source files.
+    """
+    paths = set()
+    for cls in inspect.getmro(type(solver)):
+        if cls.__module__.startswith(PACKAGE):
+            paths.update(source_files(cls.__module__))
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        h.update(file_digest(path).encode())
+    return h.hexdigest()
+
+
+class LruCache:
+    """
+    A directory of cache entries, one file each, with the least recently
+    used entries evicted once the directory grows past a size limit.
+    """
+
+    SUFFIX = ''
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        """
+        Create a new LruCache.
+
+        Args:
+            directory: The cache directory.
+            max_bytes: The size the cache is trimmed to after each new entry.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}{self.SUFFIX}')
+
+    @staticmethod
+    def touch(path: str) -> None:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        """
+        List the stored entries, least recently used first.
+
+        Returns:
+            The modification time, size and path of every entry.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+
+class ParseCache(LruCache):
+    """
+    Pickled results of init_data.
+    """
+
+    SUFFIX = '.pickle'
+
+    def __init__(self, directory: str = None,
+                 max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES) -> None:
+        """
+        Create a new ParseCache.
+
+        Args:
+            directory: The cache directory. Defaults to PARSE_CACHE_DIR_PATH
+                from the environment, or build/cache/parsed.
+            max_bytes: The size the cache is trimmed to after each new entry.
+        """
+        super().__init__(directory or os.environ.get(
+                'PARSE_CACHE_DIR_PATH', os.path.join('build', 'cache',
+                                                     'parsed')), max_bytes)
+
+    def key(self, solver: AbstractSolver, data_file_path: str) -> str:
+        """
+        Build the cache key for parsing a data file with a solver.
+
+        Args:
+            solver: The solver.
+            data_file_path: The path to the data file.
+
+        Returns:
+            The cache key.
+        """
+        h = hashlib.sha256()
+        h.update(f'{type(solver).__module__}.{type(solver).__qualname__}'
+                 .encode())
+        h.update(repr(sorted(solver.get_parameters().items())).encode())
+        h.update(solver_version(solver).encode())
+        h.update(file_digest(data_file_path).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Load an entry and mark it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The parsed data and solver state, or None on a miss.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as cache_file:
+                entry = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError):
+            return None
+        self.touch(path)
+        return entry
+
+    def put(self, key: str, data: Any, state: dict[str, Any]) -> None:
+        """
+        Store an entry, then evict the least recently used entries until the
+        cache fits in max_bytes.
+
+        Args:
+            key: The cache key.
+            data: The value returned by init_data.
+            state: The solver instance attributes right after init_data.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as cache_file:
+                pickle.dump((data, state), cache_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.get_path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.evict()
+
+
+class AnswerCache(LruCache):
+    """
+    Answers to puzzle parts, stored as one small JSON file per entry.
+
+    Changing the solver source changes the key, so stale answers are never
+    returned.
+    """
+
+    SUFFIX = '.json'
+
+    def __init__(self, directory: str = None,
+                 max_bytes: int = DEFAULT_ANSWER_CACHE_MAX_BYTES) -> None:
+        """
+        Create a new AnswerCache.
+
+        Args:
+            directory: The cache directory. Defaults to ANSWER_CACHE_DIR_PATH
+                from the environment, or build/cache/answers.
+            max_bytes: The size the cache is trimmed to after each new entry.
+        """
+        super().__init__(directory or os.environ.get(
+                'ANSWER_CACHE_DIR_PATH', os.path.join('build', 'cache',
+                                                      'answers')), max_bytes)
+
+    def key(self, solver: AbstractSolver, part: int,
+            data_file_path: str) -> str:
+        """
+        Build the cache key for one part of a puzzle.
+
+        Args:
+            solver: The solver.
+            part: The puzzle part, 1 or 2.
+            data_file_path: The path to the data file.
+
+        Returns:
+            The cache key.
+        """
+        h = hashlib.sha256()
+        h.update(f'{type(solver).__module__}.{type(solver).__qualname__}'
+                 .encode())
+        h.update(f'day{solver.get_day()} part{part}'.encode())
+        h.update(repr(sorted(solver.get_parameters().items())).encode())
+        h.update(solver_version(solver).encode())
+        h.update(file_digest(data_file_path).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """
+        Look up an answer and mark it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The answer, or None on a miss.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, 'r') as cache_file:
+                answer = json.load(cache_file)['answer']
+        except (OSError, ValueError, KeyError):
+            return None
+        self.touch(path)
+        return answer
+
+    def put(self, key: str, answer: Any) -> None:
+        """
+        Store an answer, then evict the least recently used answers until the
+        cache fits in max_bytes. Answers that cannot be stored as JSON are
+        skipped.
+
+        Args:
+            key: The cache key.
+            answer: The answer.
+        """
+        try:
+            entry = json.dumps({'answer': answer})
+        except TypeError:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as cache_file:
+            cache_file.write(entry)
+        os.replace(temp_path, self.get_path(key))
+        self.evict()
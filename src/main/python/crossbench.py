@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Compare the Python and Java day 15 solvers on the same puzzle data.
+
+Both solvers run on the bundled puzzle data and on generated data with each
+selected number of sensors. The report shows their median solve times side
+by side and whether their answers agree. The command exits with status 1
+when any answers disagree.
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from src.main.python.day15 import Solver
+from src.main.python.generate import write
+from src.main.python.results import append_records, git_commit, make_record
+from src.main.python.runner import non_negative_int, positive_int
+from src.main.python.util import BenchmarkResult, TimingStats, Timer
+
+DAY = '15'
+PARTS = (1, 2)
+DEFAULT_SIZES = [10, 100, 1000]
+JAVA_MAIN_CLASS = 'org.cbritton.aoc.y2022.Day15'
+
+
+def get_java_source_dir_path() -> str:
+    return os.path.join(os.path.dirname(__file__), os.pardir, 'java')
+
+
+def get_java_class_dir_path() -> str:
+    return os.environ.get('JAVA_CLASS_DIR_PATH', os.path.join('build', 'java'))
+
+
+def compile_java() -> str:
+    """
+    Compile the Java solvers.
+
+    Returns:
+        The directory of the compiled classes.
+    """
+    class_dir_path = get_java_class_dir_path()
+    sources = glob.glob(os.path.join(get_java_source_dir_path(), '**',
+                                     '*.java'), recursive=True)
+    try:
+        subprocess.run(['javac', '-d', class_dir_path, *sources], check=True)
+    except FileNotFoundError:
+        raise RuntimeError('javac not found; install a JDK to compare with '
+                           'the Java solver')
+    return class_dir_path
+
+
+def run_java(class_dir_path: str, data_file_path: str, repeat: int,
+             warmup: int, row: int, max_xy: int) -> list[dict]:
+    """
+    Benchmark both parts with the Java solver.
+
+    Args:
+        class_dir_path: The directory of the compiled classes.
+        data_file_path: The path to the data file.
+        repeat: The number of timed runs of each part.
+        warmup: The number of untimed runs of each part before the timed
+            runs.
+        row: The row for part 1.
+        max_xy: The size of the search area for part 2.
+
+    Returns:
+        One record per part, as printed by the Java solver.
+    """
+    completed = subprocess.run(['java', '-cp', class_dir_path,
+                                JAVA_MAIN_CLASS, data_file_path, str(repeat),
+                                str(warmup), str(row), str(max_xy)],
+                               capture_output=True, text=True, check=True)
+    return [json.loads(line) for line in completed.stdout.splitlines()
+            if line.startswith('{')]
+
+
+def to_result(record: dict) -> BenchmarkResult:
+    return BenchmarkResult(record['day'], record['part'], record['answer'],
+                           TimingStats(**record['parse']),
+                           TimingStats(**record['solve']), record['warmup'],
+                           False)
+
+
+def run_python(data_file_path: str, repeat: int, warmup: int, row: int,
+               max_xy: int) -> list[BenchmarkResult]:
+    results = []
+    for part in PARTS:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append(Solver(row, max_xy).benchmark(
+                    part, data_file_path, repeat, warmup))
+    return results
+
+
+def print_report(rows: list[tuple[str, BenchmarkResult, BenchmarkResult]]
+                 ) -> None:
+    print(f'{"Data":>8}  {"Part":>4}  {"Python Median":>20}  '
+          f'{"Java Median":>20}  {"Ratio":>8}  Answers')
+    for label, python, java in rows:
+        python_median = python.solve_stats.median
+        java_median = java.solve_stats.median
+        ratio = python_median / java_median if java_median else 0.0
+        agree = 'agree' if str(python.answer) == str(java.answer) else \
+            f'DIFFER: {python.answer} != {java.answer}'
+        print(f'{label:>8}  {python.part:>4}  '
+              f'{Timer.format_seconds(python_median):>20}  '
+              f'{Timer.format_seconds(java_median):>20}  '
+              f'{ratio:>7.1f}x  {agree}')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip(),
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-s', '--sizes', nargs='+', type=int,
+                        default=DEFAULT_SIZES,
+                        help='numbers of sensors in the generated data '
+                             f'(default: {" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed for the generated data')
+    parser.add_argument('-r', '--repeat', type=positive_int, default=5,
+                        help='number of timed runs of each part')
+    parser.add_argument('--warmup', type=non_negative_int, default=3,
+                        help='number of untimed runs of each part before '
+                             'the timed runs, which also lets the JIT '
+                             'compile the Java solver')
+    parser.add_argument('--record', action='store_true',
+                        help='append the results for the puzzle data to '
+                             '$RESULTS_FILE_PATH')
+    return parser.parse_args()
+
+
+def prepare_data(directory: str, sizes: list[int],
+                 seed: int) -> list[tuple[str, str]]:
+    """
+    Collect the data files to compare the solvers on.
+
+    Args:
+        directory: The directory to write generated data files to.
+        sizes: The numbers of sensors in the generated data.
+        seed: The random seed for the generated data.
+
+    Returns:
+        A label and path for the puzzle data and for each generated file.
+    """
+    data = [('puzzle', Solver.get_data_file_path(DAY))]
+    for size in sizes:
+        data_file_path = os.path.join(directory, f'day{DAY}-{size}.data')
+        write(DAY, size, data_file_path, seed)
+        data.append((str(size), data_file_path))
+    return data
+
+
+def main() -> None:
+    args = parse_args()
+    class_dir_path = compile_java()
+    solver = Solver()
+    rows = []
+    records = []
+    commit = git_commit() if args.record else None
+    with tempfile.TemporaryDirectory() as directory:
+        for label, data_file_path in prepare_data(directory, args.sizes,
+                                                  args.seed):
+            python_results = run_python(data_file_path, args.repeat,
+                                        args.warmup, solver.row,
+                                        solver.max_xy)
+            java_records = run_java(class_dir_path, data_file_path,
+                                    args.repeat, args.warmup, solver.row,
+                                    solver.max_xy)
+            for python, record in zip(python_results, java_records):
+                java = to_result(record)
+                rows.append((label, python, java))
+                if args.record and label == 'puzzle':
+                    records.append(make_record(python, data_file_path, commit))
+                    records.append(make_record(java, data_file_path, commit,
+                                               record['implementation'],
+                                               record['version']))
+
+    print_report(rows)
+    if args.record:
+        append_records(records)
+    if any(str(python.answer) != str(java.answer)
+           for _, python, java in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
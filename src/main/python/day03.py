@@ -52,7 +52,7 @@ class Solver(AbstractSolver):
         super().__init__()
 
     def init_data(self, data_file_path: str = None) -> Any:
-        data = self.get_data(self.get_day(), data_file_path)
+        data = self.iter_data(self.get_day(), data_file_path)
         rucksacks = []
         for line in data:
             rucksacks.append(Rucksack(line.strip()))
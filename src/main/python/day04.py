@@ -7,62 +7,113 @@ https://adventofcode.com/2022/day/4
 import os.path
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
+from src.main.python.intervals import Interval
 from src.main.python.util import AbstractSolver
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
-class Sections:
-    low: int
-    high: int
-
-    def contains(self, section_range: 'Sections') -> bool:
-        return self.low <= section_range.low <= self.high and \
-            self.low <= section_range.high <= self.high
-
-    def overlaps(self, section_range: 'Sections') -> bool:
-        return self.low <= section_range.low <= self.high or \
-            self.low <= section_range.high <= self.high
+SEPARATORS = bytes.maketrans(b'-,', b'  ')
 
 
 @dataclass
 class Pair:
-    sections_1: Sections
-    sections_2: Sections
+    sections_1: Interval
+    sections_2: Interval
 
     def has_redundant(self) -> bool:
-        return self.sections_1.contains(self.sections_2) or \
-            self.sections_2.contains(self.sections_1)
+        return self.sections_1.covers(self.sections_2) or \
+            self.sections_2.covers(self.sections_1)
 
     def has_overlap(self) -> bool:
-        return self.sections_1.overlaps(self.sections_2) or \
-            self.sections_2.overlaps(self.sections_1)
+        return self.sections_1.overlaps(self.sections_2)
+
+
+@dataclass
+class SectionColumns:
+    """
+    The bounds of every pair of assignments, one NumPy array per bound, so
+    all pairs are compared at once.
+    """
+    low_1: 'np.ndarray'
+    high_1: 'np.ndarray'
+    low_2: 'np.ndarray'
+    high_2: 'np.ndarray'
+
+    @staticmethod
+    def read(data_file_path: str) -> 'SectionColumns':
+        """
+        Parse every bound in a data file in one pass.
+
+        Args:
+            data_file_path: The path to the data file.
+
+        Returns:
+            The bounds.
+        """
+        import numpy as np
+
+        with open(data_file_path, 'rb') as data_file:
+            text = data_file.read().translate(SEPARATORS).decode('ascii')
+        bounds = np.fromstring(text, dtype=np.int64, sep=' ').reshape(-1, 4)
+        return SectionColumns(*bounds.T)
+
+    def count_redundant(self) -> int:
+        first_covers = (self.low_1 <= self.low_2) & \
+            (self.high_2 <= self.high_1)
+        second_covers = (self.low_2 <= self.low_1) & \
+            (self.high_1 <= self.high_2)
+        return int((first_covers | second_covers).sum())
+
+    def count_overlaps(self) -> int:
+        return int(((self.low_1 <= self.high_2) &
+                    (self.low_2 <= self.high_1)).sum())
 
 
 class Solver(AbstractSolver):
-    def __init__(self) -> None:
+    def __init__(self, columnar: bool = False) -> None:
+        """
+        Create a new Solver.
+
+        Args:
+            columnar: Parse the data into NumPy arrays and compare all pairs
+                at once instead of one Pair at a time.
+        """
         super().__init__()
+        self.columnar = columnar
+
+    def get_parameters(self) -> dict[str, Any]:
+        return {'columnar': self.columnar}
 
     def init_data(self, data_file_path: str = None) -> Any:
-        data = self.get_data(self.get_day(), data_file_path)
+        if self.columnar:
+            return SectionColumns.read(
+                    self.get_data_file_path(self.get_day(), data_file_path))
+
+        data = self.iter_data(self.get_day(), data_file_path)
         pattern = r'([0-9]+)-([0-9]+),([0-9]+)-([0-9]+)'
         pairs = []
         for line in data:
             m = re.search(pattern, line)
             a, b, c, d = m.group(1, 2, 3, 4)
-            pairs.append(Pair(Sections(int(a), int(b)),
-                              Sections(int(c), int(d))))
+            pairs.append(Pair(Interval(int(a), int(b)),
+                              Interval(int(c), int(d))))
 
         return pairs
 
-    def solve_part_1(self, data: list[Pair]) -> int:
+    def solve_part_1(self, data: list[Pair] | SectionColumns) -> int:
+        if self.columnar:
+            return data.count_redundant()
         answer = 0
         for pair in data:
             answer += 1 if pair.has_redundant() else 0
         return answer
 
-    def solve_part_2(self, data: list[Pair]) -> int:
+    def solve_part_2(self, data: list[Pair] | SectionColumns) -> int:
+        if self.columnar:
+            return data.count_overlaps()
         answer = 0
         for pair in data:
             answer += 1 if pair.has_overlap() else 0
@@ -71,7 +71,7 @@ class Solver(AbstractSolver):
 
         move_data = data[idx + 1:]
 
-        stack_header_pattern = r'\s?(\[\S+\]|\s\s\s)\s?'
+        stack_header_pattern = r'(\[\S+\]|\s\s\s)\s?'
 
         self.cargo = Cargo()
         for line in stack_data:
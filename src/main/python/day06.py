@@ -5,31 +5,99 @@ Day 6: Tuning Trouble
 https://adventofcode.com/2022/day/6
 """
 import os.path
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from src.main.python.util import AbstractSolver
 
-
-@dataclass
-class SignalData:
-    value: str
-
-    def start_of_packet_index(self) -> int:
-        for i in range(len(self.value) - 4):
-            window = self.value[i:i + 4]
-            char_count = set(window)
-            if len(window) == len(char_count):
-                return i + 1
-        return -1
-
-    def start_of_message_index(self, start_idx: int) -> int:
-        for i in range(start_idx, len(self.value) - 14):
-            window = self.value[i:i + 14]
-            char_count = set(window)
-            if len(window) == len(char_count):
-                return i + 1
-        return -1
+PACKET_MARKER_SIZE = 4
+MESSAGE_MARKER_SIZE = 14
+CHUNK_SIZE = 1 << 16
+
+
+class MarkerDetector:
+    """
+    Finds the first run of distinct characters of a given size in a
+    datastream that arrives in chunks.
+
+    The detector remembers where it last saw each character. When a
+    character repeats inside the current window, the window jumps to start
+    just past the earlier copy, so every character is looked at once and
+    only the last-seen positions are kept between chunks.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Create a new MarkerDetector.
+
+        Args:
+            size: The number of distinct characters in a marker.
+        """
+        self.size = size
+        self.last_seen = dict()
+        self.start = 0
+        self.position = 0
+        self.marker = -1
+
+    def feed(self, chunk: str) -> int:
+        """
+        Scan the next chunk of the datastream.
+
+        Args:
+            chunk: The characters that follow the previous chunk.
+
+        Returns:
+            The number of characters up to and including the end of the
+            first marker, or -1 if no marker has been found yet.
+        """
+        if self.marker != -1:
+            return self.marker
+        size, last_seen = self.size, self.last_seen
+        start, position = self.start, self.position
+        for char in chunk:
+            start = max(start, last_seen.get(char, -1) + 1)
+            last_seen[char] = position
+            position += 1
+            if position - start == size:
+                self.marker = position
+                break
+        self.start, self.position = start, position
+        return self.marker
+
+
+def find_marker(chunks: Iterable[str], size: int) -> int:
+    """
+    Find the end of the first marker in a datastream.
+
+    Args:
+        chunks: The datastream, in chunks of any length.
+        size: The number of distinct characters in a marker.
+
+    Returns:
+        The number of characters up to and including the end of the first
+        marker, or -1 if there is none.
+    """
+    detector = MarkerDetector(size)
+    for chunk in chunks:
+        if detector.feed(chunk) != -1:
+            break
+    return detector.marker
+
+
+def read_chunks(data_file_path: str,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Read a datastream a chunk at a time, so it never has to fit in memory.
+
+    Args:
+        data_file_path: The path to the data file.
+        chunk_size: The number of characters in each chunk.
+
+    Returns:
+        An iterator over the chunks, without line endings.
+    """
+    with open(data_file_path) as data_file:
+        while chunk := data_file.read(chunk_size):
+            yield chunk.rstrip('\n')
 
 
 class Solver(AbstractSolver):
@@ -37,16 +105,15 @@ class Solver(AbstractSolver):
         super().__init__()
 
     def init_data(self, data_file_path: str = None) -> Any:
-        return list(self.get_data(self.get_day(), data_file_path))
+        # Each part streams the datastream from the file with read_chunks,
+        # so the whole datastream is never held in memory.
+        return self.get_data_file_path(self.get_day(), data_file_path)
 
-    def solve_part_1(self, data: list[Any]) -> int:
-        signalData = SignalData(data[0])
-        return signalData.start_of_packet_index() + 3
+    def solve_part_1(self, data_file_path: str) -> int:
+        return find_marker(read_chunks(data_file_path), PACKET_MARKER_SIZE)
 
-    def solve_part_2(self, data: list[Any]) -> int:
-        signalData = SignalData(data[0])
-        start_idx = signalData.start_of_packet_index()
-        return signalData.start_of_message_index(start_idx) + 13
+    def solve_part_2(self, data_file_path: str) -> int:
+        return find_marker(read_chunks(data_file_path), MESSAGE_MARKER_SIZE)
 
     def get_day(self) -> str:
         return os.path.basename(__file__)[3:5]
@@ -4,36 +4,64 @@ Day 8: Treetop Tree House
 
 https://adventofcode.com/2022/day/8
 """
+import heapq
 import os.path
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence, TYPE_CHECKING
 
 from src.main.python.util import AbstractSolver
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
-class Tree:
-    height: int
+MAX_HEIGHT = 9
+HEIGHTS = bytes.maketrans(b'0123456789', bytes(range(10)))
 
 
 class Grove:
-    trees: list[list[Tree]]
+    """
+    The height of every tree, one byte each, stored row by row in a single
+    bytes object. The tree at a row and column is at row * stride + col.
+    """
 
     def __init__(self, data: list[str]):
-        self.trees = Grove.build(data)
+        self.rows = len(data)
+        self.cols = len(data[0]) if data else 0
+        self.stride = self.cols
+        self.heights = ''.join(data).encode().translate(HEIGHTS)
+
+    def height(self, row: int, col: int) -> int:
+        return self.heights[row * self.stride + col]
+
+    def row(self, row: int) -> bytes:
+        return self.heights[row * self.stride:(row + 1) * self.stride]
+
+    def column(self, col: int) -> bytes:
+        return self.heights[col::self.stride]
+
+    def as_array(self) -> 'np.ndarray':
+        """
+        View the heights as a NumPy array without copying them.
+
+        Returns:
+            A read-only uint8 array with one row per row of trees.
+        """
+        import numpy as np
+
+        return np.frombuffer(self.heights, dtype=np.uint8).reshape(
+                self.rows, self.cols)
 
     def is_visible_from_left(self, row: int, col: int) -> bool:
         result = True
         for c in range(col):
-            if self.trees[row][c].height >= self.trees[row][col].height:
+            if self.height(row, c) >= self.height(row, col):
                 result = False
                 break
         return result
 
     def is_visible_from_right(self, row: int, col: int) -> bool:
         result = True
-        for c in range(col + 1, len(self.trees[row])):
-            if self.trees[row][c].height >= self.trees[row][col].height:
+        for c in range(col + 1, self.cols):
+            if self.height(row, c) >= self.height(row, col):
                 result = False
                 break
         return result
@@ -41,15 +69,15 @@ class Grove:
     def is_visible_from_top(self, row: int, col: int) -> bool:
         result = True
         for r in range(row):
-            if self.trees[r][col].height >= self.trees[row][col].height:
+            if self.height(r, col) >= self.height(row, col):
                 result = False
                 break
         return result
 
     def is_visible_from_bottom(self, row: int, col: int) -> bool:
         result = True
-        for r in range(row + 1, len(self.trees)):
-            if self.trees[r][col].height >= self.trees[row][col].height:
+        for r in range(row + 1, self.rows):
+            if self.height(r, col) >= self.height(row, col):
                 result = False
                 break
         return result
@@ -60,19 +88,62 @@ class Grove:
             self.is_visible_from_bottom(row, col) or \
             self.is_visible_from_left(row, col)
 
+    def visibility_mask(self) -> list[list[bool]]:
+        """
+        Find which trees are visible from outside the grove.
+
+        Every row and every column is swept from both ends, so each tree is
+        looked at four times in total.
+
+        Returns:
+            Whether each tree is visible, by row and column.
+        """
+        mask = [Grove.visible_in_line(self.row(r)) for r in range(self.rows)]
+        for c in range(self.cols):
+            column = self.column(c)
+            for r, visible in enumerate(Grove.visible_in_line(column)):
+                mask[r][c] = mask[r][c] or visible
+        return mask
+
+    @staticmethod
+    def visible_in_line(heights: Sequence[int]) -> list[bool]:
+        """
+        Find which trees in a line are visible from either end of it.
+
+        A tree is visible from an end when it is taller than the running
+        maximum of the trees between it and that end.
+
+        Args:
+            heights: The heights of the trees in the line.
+
+        Returns:
+            Whether each tree is visible.
+        """
+        visible = [False] * len(heights)
+        for order in (range(len(heights)), range(len(heights) - 1, -1, -1)):
+            tallest = -1
+            for i in order:
+                if heights[i] > tallest:
+                    visible[i] = True
+                    tallest = heights[i]
+                    # Nothing behind the tallest possible tree is visible.
+                    if tallest == MAX_HEIGHT:
+                        break
+        return visible
+
     def viewing_distance_left(self, row: int, col: int) -> int:
         result = 0
         for c in range(col - 1, -1, -1):
             result += 1
-            if self.trees[row][c].height >= self.trees[row][col].height:
+            if self.height(row, c) >= self.height(row, col):
                 break
         return result if result > 0 else 1
 
     def viewing_distance_right(self, row: int, col: int) -> int:
         result = 0
-        for c in range(col + 1, len(self.trees[row])):
+        for c in range(col + 1, self.cols):
             result += 1
-            if self.trees[row][c].height >= self.trees[row][col].height:
+            if self.height(row, c) >= self.height(row, col):
                 break
         return result if result > 0 else 1
 
@@ -80,15 +151,15 @@ class Grove:
         result = 0
         for r in range(row - 1, -1, -1):
             result += 1
-            if self.trees[r][col].height >= self.trees[row][col].height:
+            if self.height(r, col) >= self.height(row, col):
                 break
         return result if result > 0 else 1
 
     def viewing_distance_down(self, row: int, col: int) -> int:
         result = 0
-        for r in range(row + 1, len(self.trees)):
+        for r in range(row + 1, self.rows):
             result += 1
-            if self.trees[r][col].height >= self.trees[row][col].height:
+            if self.height(r, col) >= self.height(row, col):
                 break
         return result if result > 0 else 1
 
@@ -98,22 +169,74 @@ class Grove:
             self.viewing_distance_down(row, col) * \
             self.viewing_distance_left(row, col)
 
-    def high_scenic_score(self) -> int:
-        result = 0
-        for row in range(len(self.trees)):
-            for col in range(len(self.trees[row])):
-                result = max(result, self.get_scenic_score(row, col))
-        return result
+    def scenic_scores(self) -> list[list[int]]:
+        """
+        Find the scenic score of every tree.
+
+        The viewing distances in each direction come from one pass along
+        every row and column in each direction, so every tree is pushed onto
+        and popped from a stack at most four times.
+
+        Returns:
+            The scenic score of each tree, by row and column.
+        """
+        scores = []
+        for r in range(self.rows):
+            row = self.row(r)
+            left = Grove.viewing_distances(row)
+            right = Grove.viewing_distances(row[::-1])[::-1]
+            scores.append([a * b for a, b in zip(left, right)])
+        for c in range(self.cols):
+            column = self.column(c)
+            up = Grove.viewing_distances(column)
+            down = Grove.viewing_distances(column[::-1])[::-1]
+            for r, (a, b) in enumerate(zip(up, down)):
+                scores[r][c] *= a * b
+        return scores
 
     @staticmethod
-    def build(data: list[str]) -> list[list[Tree]]:
-        trees = []
-        for line in data:
-            tree_row = []
-            for height in list(line):
-                tree_row.append(Tree(int(height)))
-            trees.append(tree_row)
-        return trees
+    def viewing_distances(heights: Sequence[int]) -> list[int]:
+        """
+        Find how far each tree in a line can see toward the start of it.
+
+        A tree sees up to and including the first tree at least as tall as
+        itself, or up to the edge. As in the viewing_distance_* methods, a
+        tree on the edge counts as seeing one tree. The stack holds the
+        trees that could still block a later tree, from tallest to shortest.
+
+        Args:
+            heights: The heights of the trees in the line.
+
+        Returns:
+            The viewing distance of each tree.
+        """
+        distances = [0] * len(heights)
+        stack = []
+        for i, height in enumerate(heights):
+            while stack and heights[stack[-1]] < height:
+                stack.pop()
+            distances[i] = i - stack[-1] if stack else max(i, 1)
+            stack.append(i)
+        return distances
+
+    def best_trees(self, k: int) -> list[tuple[int, int, int]]:
+        """
+        Find the trees with the highest scenic scores.
+
+        Args:
+            k: The number of trees to find.
+
+        Returns:
+            The score, row and column of each tree, from the highest score
+            down.
+        """
+        return heapq.nlargest(k, ((score, row, col)
+                                  for row, scores in
+                                  enumerate(self.scenic_scores())
+                                  for col, score in enumerate(scores)))
+
+    def high_scenic_score(self) -> int:
+        return max(map(max, self.scenic_scores()), default=0)
 
 
 class Solver(AbstractSolver):
@@ -125,19 +248,10 @@ class Solver(AbstractSolver):
         return Grove(self.get_data(self.get_day(), data_file_path))
 
     def solve_part_1(self, grove: Grove) -> int:
-        answer = 0
-        for row in range(len(grove.trees)):
-            for col in range(len(grove.trees[row])):
-                if grove.is_tree_visible(row, col):
-                    answer += 1
-        return answer
+        return sum(map(sum, grove.visibility_mask()))
 
     def solve_part_2(self, grove: Grove) -> int:
-        answer = 0
-        for row in range(len(grove.trees)):
-            for col in range(len(grove.trees[row])):
-                answer = max(answer, grove.get_scenic_score(row, col))
-        return answer
+        return grove.high_scenic_score()
 
     def get_day(self) -> str:
         return os.path.basename(__file__)[3:5]
@@ -5,10 +5,13 @@ Day 9: Rope Bridge
 https://adventofcode.com/2022/day/9
 """
 import os.path
+from array import array
 from typing import Any
 
 from src.main.python.util import AbstractSolver
 
+STEPS = {'U': (0, 1), 'D': (0, -1), 'L': (-1, 0), 'R': (1, 0)}
+
 
 class Move:
 
@@ -19,298 +22,140 @@ class Move:
     def __repr__(self):
         return f'{self.direction} {self.count}'
 
-    def is_up(self):
-        return self.direction == 'U'
-
-    def is_down(self):
-        return self.direction == 'D'
-
-    def is_left(self):
-        return self.direction == 'L'
-
-    def is_right(self):
-        return self.direction == 'R'
 
+class Rope:
+    """
+    A rope of any number of knots, head first. The coordinates of the knots
+    are kept in two arrays, so a step is a tight loop over indices and the
+    length of the rope is limited only by memory.
+    """
+
+    def __init__(self, knot_count: int, track_tail: bool = True,
+                 track_all: bool = False) -> None:
+        """
+        Create a new Rope with every knot at the origin.
+
+        Args:
+            knot_count: The number of knots, including the head.
+            track_tail: Record every position the tail visits.
+            track_all: Record every position every knot visits. The knots
+                ahead of a knot never depend on the knots behind it, so the
+                positions of knot i are also those of the tail of a rope of
+                i + 1 knots.
+        """
+        if knot_count < 1:
+            raise RuntimeError(f'A rope needs at least one knot: {knot_count}')
+        self.xs = array('q', [0]) * knot_count
+        self.ys = array('q', [0]) * knot_count
+        self.visited_by_knot = [{(0, 0)} for _ in range(knot_count)] \
+            if track_all else None
+        if track_all and track_tail:
+            self.visited = self.visited_by_knot[-1]
+        else:
+            self.visited = {(0, 0)} if track_tail else None
 
-class Knot:
-    last_id: int = 0
-
-    def __init__(self, x: int, y: int) -> None:
-        self.x = x
-        self.y = y
-        self.prev = None
-        self.next = None
-        self.visited = set()
-        self.add_visited((x, y))
-        self.id = Knot.last_id
-        Knot.last_id += 1
+    def __len__(self) -> int:
+        return len(self.xs)
 
-    def __repr__(self):
-        return f'id={self.id} ({self.x:>3}, {self.y:>3})'
+    def tail(self) -> tuple[int, int]:
+        return self.xs[-1], self.ys[-1]
 
-    def is_head(self):
-        return self.prev is None
+    def visited_counts(self) -> list[int]:
+        """
+        Count the positions each knot has visited. Only available when the
+        rope tracks every knot.
 
-    def is_tail(self):
-        return self.next is None
-
-    def add_knot(self, knot: 'Knot'):
-        self.next = knot
-        knot.prev = self
+        Returns:
+            The number of positions visited by each knot, head first.
+        """
+        if self.visited_by_knot is None:
+            raise RuntimeError('The rope does not track every knot')
+        return [len(visited) for visited in self.visited_by_knot]
 
     def move(self, move: Move) -> None:
-        if move.is_up():
-            self._move_up(move.count)
-        elif move.is_down():
-            self._move_down(move.count)
-        elif move.is_left():
-            self._move_left(move.count)
-        elif move.is_right():
-            self._move_right(move.count)
-        else:
+        """
+        Move the head one step at a time, pulling the rest of the rope after
+        it.
+
+        A knot that is more than one square from the knot before it steps
+        one square toward it along each axis where they differ. Once a knot
+        stays put, none of the knots after it can move either.
+
+        Args:
+            move: The direction and number of steps to move the head.
+        """
+        if move.direction not in STEPS:
             raise RuntimeError(f'Unknown move: {move}')
-
-    def _move_up(self, count: int):
-        for y in range(self.y + 1, self.y + count + 1):
-            self.y += 1
-            self.follow()
-
-    def _move_down(self, count: int):
-        for y in range(self.y - 1, self.y - count - 1, -1):
-            self.y -= 1
-            self.follow()
-
-    def _move_right(self, count: int):
-        for x in range(self.x + 1, self.x + count + 1):
-            self.x += 1
-            self.follow()
-
-    def _move_left(self, count: int):
-        for x in range(self.x - 1, self.x - count - 1, -1):
-            self.x -= 1
-            self.follow()
-
-    def is_e_of(self, knot: 'Knot'):
-        return self.x > knot.x and self.y == knot.y
-
-    def is_n_of(self, knot: 'Knot'):
-        return self.x == knot.x and self.y > knot.y
-
-    def is_w_of(self, knot: 'Knot'):
-        return self.x < knot.x and self.y == knot.y
-
-    def is_s_of(self, knot: 'Knot'):
-        return self.x == knot.x and self.y < knot.y
-
-    def is_ne_of(self, knot: 'Knot'):
-        return self.x > knot.x and self.y > knot.y
-
-    def is_nw_of(self, knot: 'Knot'):
-        return self.x < knot.x and self.y > knot.y
-
-    def is_sw_of(self, knot: 'Knot'):
-        return self.x < knot.x and self.y < knot.y
-
-    def is_se_of(self, knot: 'Knot'):
-        return self.x > knot.x and self.y < knot.y
-
-    def follow(self) -> None:
-        if self.is_head():
-            self.next.follow()
-            return
-        if self.is_adjacent_or_same():
-            return
-        if self.prev.is_e_of(self):
-            self._move_e()
-        elif self.prev.is_ne_of(self):
-            self._move_ne()
-        elif self.prev.is_n_of(self):
-            self._move_n()
-        elif self.prev.is_nw_of(self):
-            self._move_nw()
-        elif self.prev.is_w_of(self):
-            self._move_w()
-        elif self.prev.is_sw_of(self):
-            self._move_sw()
-        elif self.prev.is_s_of(self):
-            self._move_s()
-        elif self.prev.is_se_of(self):
-            self._move_se()
-
-        if not self.is_tail():
-            self.next.follow()
-
-    def is_diagonal(self):
-        if abs(self.x - self.prev.x) == abs(self.y - self.prev.y):
-            return True
-        return False
-
-    def _move_e(self):
-        self._move_e_near_x()
-
-    def _move_e_near_x(self):
-        for x in range(self.x + 1, self.prev.x):
-            self.add_visited((x, self.prev.y))
-        self.x = self.prev.x - 1
-        self.y = self.prev.y
-
-    def _move_ene(self):
-        self._move_e_near_x()
-
-    def _move_ne(self):
-        if self.is_diagonal():
-            self._move_ne_exactly()
-        elif abs(abs(self.y) - abs(self.prev.y)) == 1:
-            self._move_ene()
-        else:
-            self._move_nne()
-
-    def _move_ne_exactly(self):
-        for x, y in zip(range(self.x + 1, self.prev.x),
-                        range(self.y + 1, self.prev.y)):
-            self.add_visited((x, y))
-        self.x = self.prev.x - 1
-        self.y = self.prev.y - 1
-
-    def _move_n_near_y(self):
-        for y in range(self.y + 1, self.prev.y):
-            self.add_visited((self.prev.x, y))
-        self.x = self.prev.x
-        self.y = self.prev.y - 1
-
-    def _move_nne(self):
-        self._move_n_near_y()
-
-    def _move_n(self):
-        self._move_n_near_y()
-
-    def _move_nnw(self):
-        self._move_n_near_y()
-
-    def _move_nw(self):
-        if self.is_diagonal():
-            self._move_nw_exactly()
-        elif abs(abs(self.x) - abs(self.prev.x)) == 1:
-            self._move_nnw()
-        else:
-            self._move_wnw()
-
-    def _move_nw_exactly(self):
-        for x, y in zip(range(self.x - 1, self.prev.x, -1),
-                        range(self.y + 1, self.prev.y)):
-            self.add_visited((x, y))
-        self.x = self.prev.x + 1
-        self.y = self.prev.y - 1
-
-    def _move_w_near_x(self):
-        for x in range(self.x - 1, self.prev.x, -1):
-            self.add_visited((x, self.prev.y))
-        self.x = self.prev.x + 1
-        self.y = self.prev.y
-
-    def _move_wnw(self):
-        self._move_w_near_x()
-
-    def _move_w(self):
-        self._move_w_near_x()
-
-    def _move_wsw(self):
-        self._move_w_near_x()
-
-    def _move_sw(self):
-        if self.is_diagonal():
-            self._move_sw_exactly()
-        elif abs(abs(self.y) - abs(self.prev.y)) == 1:
-            self._move_wsw()
-        else:
-            self._move_ssw()
-
-    def _move_sw_exactly(self):
-        for x, y in zip(range(self.x - 1, self.prev.x, -1),
-                        range(self.y - 1, self.prev.y, -1)):
-            self.add_visited((x, y))
-        self.x = self.prev.x + 1
-        self.y = self.prev.y + 1
-
-    def _move_s_near_y(self):
-        for y in range(self.y - 1, self.prev.y, -1):
-            self.add_visited((self.prev.x, y))
-        self.x = self.prev.x
-        self.y = self.prev.y + 1
-
-    def _move_ssw(self):
-        self._move_s_near_y()
-
-    def _move_s(self):
-        self._move_s_near_y()
-
-    def _move_sse(self):
-        self._move_s_near_y()
-
-    def _move_se(self):
-        if self.is_diagonal():
-            self._move_se_exactly()
-        elif abs(abs(self.x) - abs(self.prev.x)) == 1:
-            self._move_sse()
-        else:
-            self._move_ese()
-
-    def _move_se_exactly(self):
-        for x, y in zip(range(self.x + 1, self.prev.x),
-                        range(self.y - 1, self.prev.y, -1)):
-            self.add_visited((x, y))
-        self.x = self.prev.x - 1
-        self.y = self.prev.y + 1
-
-    def _move_ese(self):
-        self._move_e_near_x()
-
-    def is_adjacent_or_same(self) -> bool:
-        return self.prev.x in range(self.x - 1, self.x + 2) and \
-            self.prev.y in range(self.y - 1, self.y + 2)
-
-    def add_visited(self, xy: tuple[int, int]):
-        if self.is_tail():
-            self.visited.add(xy)
+        step_x, step_y = STEPS[move.direction]
+        step, knot_count = self._step, len(self.xs)
+        visited, visited_by_knot = self.visited, self.visited_by_knot
+        xs, ys = self.xs, self.ys
+        for _ in range(move.count):
+            moved = step(step_x, step_y)
+            if visited_by_knot is not None:
+                for i in range(moved):
+                    visited_by_knot[i].add((xs[i], ys[i]))
+            elif visited is not None and moved == knot_count:
+                visited.add((xs[-1], ys[-1]))
+
+    def _step(self, step_x: int, step_y: int) -> int:
+        # Moves the head one square and pulls the knots after it. Returns
+        # the number of knots that moved, which always includes the head.
+        xs, ys = self.xs, self.ys
+        xs[0] += step_x
+        ys[0] += step_y
+        for i in range(1, len(xs)):
+            dx = xs[i - 1] - xs[i]
+            dy = ys[i - 1] - ys[i]
+            if -1 <= dx <= 1 and -1 <= dy <= 1:
+                return i
+            xs[i] += (dx > 0) - (dx < 0)
+            ys[i] += (dy > 0) - (dy < 0)
+        return len(xs)
 
 
 class Solver(AbstractSolver):
 
     def __init__(self) -> None:
         super().__init__()
-        self.head = None
-        self.move = None
 
     def init_data(self, data_file_path: str = None) -> Any:
-        data = self.get_data(self.get_day(), data_file_path)
-        return [Move(x[0], int(x[1])) for x in [a.split() for a in data]]
+        return self.parse_moves(self.get_data(self.get_day(), data_file_path))
 
-    def init_rope(self, knot_count: int):
-        self.head = Knot(0, 0)
-        for _ in range(1, knot_count):
-            knot = Knot(0, 0)
-            self.get_tail().add_knot(knot)
-
-    def get_tail(self) -> Knot:
-        knot = self.head
-        while not knot.is_tail():
-            knot = knot.next
-        return knot
-
-    def solve_part_1(self, moves: Any) -> int:
-        self.init_rope(2)
-        for move in moves:
-            self.head.move(move)
-
-        return len(self.get_tail().visited)
+    @staticmethod
+    def parse_moves(data: list[str]) -> list[Move]:
+        return [Move(x[0], int(x[1])) for x in [a.split() for a in data]]
 
-    def solve_part_2(self, moves: Any) -> int:
-        self.init_rope(10)
+    @staticmethod
+    def simulate(moves: list[Move], knot_count: int,
+                 track_all: bool = False) -> Rope:
+        rope = Rope(knot_count, track_all=track_all)
         for move in moves:
-            self.move = move
-            self.head.move(move)
-
-        return len(self.get_tail().visited)
+            rope.move(move)
+        return rope
+
+    @staticmethod
+    def visited_counts(moves: list[Move], max_knot_count: int) -> list[int]:
+        """
+        Count the positions visited by the tail of every rope up to a length,
+        with one simulation of the longest rope.
+
+        Args:
+            moves: The moves of the head.
+            max_knot_count: The number of knots in the longest rope.
+
+        Returns:
+            The number of positions visited by the tail of a rope of k knots,
+            at index k - 1.
+        """
+        return Solver.simulate(moves, max_knot_count,
+                               track_all=True).visited_counts()
+
+    def solve_part_1(self, moves: list[Move]) -> int:
+        return len(self.simulate(moves, 2).visited)
+
+    def solve_part_2(self, moves: list[Move]) -> int:
+        return len(self.simulate(moves, 10).visited)
 
     def get_day(self) -> str:
         return os.path.basename(__file__)[3:5]
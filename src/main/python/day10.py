@@ -112,7 +112,7 @@ class Solver(AbstractSolver):
         super().__init__()
 
     def init_data(self, data_file_path: str = None) -> Any:
-        d = self.get_data(self.get_day(), data_file_path)
+        d = self.iter_data(self.get_day(), data_file_path)
         return [Op(tuple(x)) for x in [a.split() for a in d]]
 
     def solve_part_1(self, ops: Any) -> int:
@@ -19,8 +19,6 @@ from typing import Any
 
 from src.main.python.util import AbstractSolver
 
-total_modulo = 1
-
 
 class Item:
     last_id = -1
@@ -50,12 +48,10 @@ class Operation:
     def __init__(self, expr):
         self.expr = expr
 
-        def execute(self, old):
-            replace = self.expr.replace('old', str(old))
-            result = eval(replace)
-            return result
-
-        setattr(Operation, 'execute', execute)
+    def execute(self, old):
+        replace = self.expr.replace('old', str(old))
+        result = eval(replace)
+        return result
 
 
 class Monkey:
@@ -70,6 +66,7 @@ class Monkey:
         self.test_false = 0
         self.inspection_count = 0
         self.deleted_items = []
+        self.monkeys = []
 
     def __repr__(self) -> str:
         return f'monkey_id={self.monkey_id}, ' \
@@ -80,14 +77,14 @@ class Monkey:
                f'inspection_count={self.inspection_count}, ' \
                f'items={self.items}'
 
-    def inspect_items(self, worry_factor: int):
+    def inspect_items(self, worry_factor: int, total_modulo: int):
         self.deleted_items.clear()
         for item in self.items:
-            self.inspect_item(item, worry_factor)
+            self.inspect_item(item, worry_factor, total_modulo)
         for item in self.deleted_items:
             self.items.remove(item)
 
-    def inspect_item(self, item: Item, worry_factor: int):
+    def inspect_item(self, item: Item, worry_factor: int, total_modulo: int):
         item.worry_level = self.operation.execute(item.worry_level)
         assert item.worry_level
 
@@ -116,11 +113,12 @@ class Solver(AbstractSolver):
     def __init__(self) -> None:
         super().__init__()
         self.monkeys = None
+        self.total_modulo = 1
 
     def init_data(self, data_file_path: str = None) -> Any:
         data = self.get_data(self.get_day(), data_file_path)
         monkeys = []
-        Monkey.monkeys = monkeys
+        self.total_modulo = 1
         monkey = None
         for line in data:
             result = self.parse_line(line)
@@ -128,14 +126,14 @@ class Solver(AbstractSolver):
                 monkeys.append(monkey)
             elif result[0] == 'monkey':
                 monkey = Monkey(result[1])
+                monkey.monkeys = monkeys
             elif result[0] == 'starting':
                 monkey.items = result[1]
             elif result[0] == 'operation':
                 monkey.operation = result[1]
             elif result[0] == 'test':
                 monkey.test_div = result[1]
-                global total_modulo
-                total_modulo *= int(monkey.test_div)
+                self.total_modulo *= int(monkey.test_div)
             elif result[0] == 'true':
                 monkey.test_true = result[1]
             elif result[0] == 'false':
@@ -181,7 +179,7 @@ class Solver(AbstractSolver):
 
     def evaluate_round(self, worry_factor: int) -> None:
         for monkey in self.monkeys:
-            monkey.inspect_items(worry_factor)
+            monkey.inspect_items(worry_factor, self.total_modulo)
 
     def solve_part_1(self, monkeys: list[Monkey]) -> int:
         # return 0
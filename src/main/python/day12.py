@@ -5,166 +5,144 @@ Day 12: Hill Climbing Algorithm
 https://adventofcode.com/2022/day/12
 """
 import os.path
-from functools import cache
-from typing import Any
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
 
 from src.main.python.util import AbstractSolver
 
+UNREACHED = -1
+WALL = 255
+ELEVATIONS = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyzSE',
+                             bytes(range(26)) + bytes([0, 25]))
+
+
+@dataclass
+class ShortestPaths:
+    """
+    The result of a breadth-first search. Both lists are indexed by cell.
+    Cells the search did not reach have a distance and predecessor of
+    UNREACHED. After a reverse search, the distance of a cell is the fewest
+    steps from that cell to the nearest source, and its predecessor is the
+    next cell on the way there.
+    """
+    distances: array
+    predecessors: array
+
+    def path_to(self, cell: int) -> list[int]:
+        """
+        Follow the predecessors back from a cell.
+
+        Args:
+            cell: The last cell of the path.
+
+        Returns:
+            The cells from the nearest source of the search to the cell, or
+            an empty list if the search did not reach it.
+        """
+        if self.distances[cell] == UNREACHED:
+            return []
+        path = [cell]
+        while self.predecessors[cell] != UNREACHED:
+            cell = self.predecessors[cell]
+            path.append(cell)
+        return list(reversed(path))
+
 
-class Node:
+class HeightMap:
+    """
+    The elevation of every square, one byte each, stored row by row in a
+    bytearray. The map is surrounded by a border of WALL cells, so the
+    neighbors of a cell are always at the same offsets and never need a
+    bounds check. A square at row r and column c is the cell
+    (r + 1) * width + c + 1.
+    """
+
+    def __init__(self, lines: list[str]) -> None:
+        self.rows = len(lines)
+        self.cols = len(lines[0])
+        self.width = self.cols + 2
+        self.offsets = (-self.width, 1, self.width, -1)
+        self.heights = bytearray([WALL]) * (self.width * (self.rows + 2))
+        self.start = UNREACHED
+        self.end = UNREACHED
+        for r, line in enumerate(lines):
+            first = (r + 1) * self.width + 1
+            self.heights[first:first + self.cols] = \
+                line.encode().translate(ELEVATIONS)
+            if 'S' in line:
+                self.start = first + line.index('S')
+            if 'E' in line:
+                self.end = first + line.index('E')
+
+    def get_lowest(self) -> list[int]:
+        return [i for i, h in enumerate(self.heights) if h == 0]
+
+    def neighbors(self, cell: int) -> Iterator[int]:
+        for offset in self.offsets:
+            if self.heights[cell + offset] != WALL:
+                yield cell + offset
+
+    def bfs(self, sources: Iterable[int],
+            reverse: bool = False) -> ShortestPaths:
+        """
+        Find the fewest steps from the nearest of some cells to every cell.
+        A step may climb at most one unit but may drop any number of units.
+
+        Args:
+            sources: The cells to start from.
+            reverse: Search against the direction of the steps instead, which
+                finds the fewest steps from every cell to the nearest
+                source.
+
+        Returns:
+            The distances and predecessors of every cell.
+        """
+        heights = self.heights
+        distances = array('i', [UNREACHED]) * len(heights)
+        predecessors = array('i', [UNREACHED]) * len(heights)
+
+        # Every cell is queued at most once, so the queue is a fixed array.
+        queue = array('i', sources)
+        head, tail = 0, len(queue)
+        queue.extend(array('i', [0]) * (len(heights) - tail))
+        for cell in queue[:tail]:
+            distances[cell] = 0
+
+        while head < tail:
+            cell = queue[head]
+            head += 1
+            if reverse:
+                lowest, highest = heights[cell] - 1, 25
+            else:
+                lowest, highest = 0, heights[cell] + 1
+            distance = distances[cell] + 1
+            for offset in self.offsets:
+                n = cell + offset
+                if distances[n] == UNREACHED and \
+                        lowest <= heights[n] <= highest:
+                    distances[n] = distance
+                    predecessors[n] = cell
+                    queue[tail] = n
+                    tail += 1
+        return ShortestPaths(distances, predecessors)
 
-    def __init__(self, name, location) -> None:
-        self.name = name
-        self.location = location
-        self.nodes = set()
 
 class Solver(AbstractSolver):
     def __init__(self) -> None:
         super().__init__()
-        self.data = None
 
     def init_data(self, data_file_path: str = None) -> Any:
-        return self.get_data(self.get_day(), data_file_path)
-
-    def get_neighbor_indexes(self, d, r, c):
-        indices = []
-        if r != 0:
-            indices.append((r - 1, c))
-        if c != len(d[r]) - 1:
-            indices.append((r, c + 1))
-        if r != len(d) - 1:
-            indices.append((r + 1, c))
-        if c != 0:
-            indices.append((r, c - 1))
-        return indices
-
-    def get_distance(self, n1: Node, n2: Node):
-        if n1.name == 'S':
-            n1v = ord('a')
-        elif n1.name == 'E':
-            n1v = ord('z')
-        else:
-            n1v = ord(n1.name)
-
-        if n2.name == 'S':
-            n2v = ord('a')
-        elif n2.name == 'E':
-            n2v = ord('z')
-        else:
-            n2v = ord(n2.name)
-
-        return n2v - n1v + 30
-
-    @cache
-    def build_graph(self):
-        nodes = dict()
-        for r in range(len(self.data)):
-            for c in range(len(self.data[0])):
-                if (r, c) in nodes:
-                    node = nodes[(r, c)]
-                else:
-                    node = Node(self.data[r][c], (r, c))
-                    nodes[(r, c)] = node
-
-                for nr, nc in self.get_neighbor_indexes(self.data, r, c):
-                    if (nr, nc) in nodes:
-                        nn = nodes[(nr, nc)]
-                    else:
-                        nn = Node(self.data[nr][nc], (nr, nc))
-                        nodes[(nr, nc)] = nn
-                    node.nodes.add(nn)
-        return list(nodes.values())
-
-    def get_start(self, nodes):
-        for n in nodes:
-            if n.name == 'S':
-                return n
-        return None
-
-    def get_all_starts(self, nodes):
-        starts = []
-        for n in nodes:
-            if n.name == 'a' or n.name == 'S':
-                starts.append(n)
-        return starts
-
-    def get_end(self, nodes):
-        for n in nodes:
-            if n.name == 'E':
-                return n
-        return None
-
-    def visit(self, node: Node, unvisited: set, distance: dict, prev):
-        for c in node.nodes:
-            if c in unvisited:
-                d = self.get_distance(node, c)
-                if d - 30 > 1:
-                    continue
-                d += distance[node]
-                if d < distance[c]:
-                    distance[c] = d
-                    prev[c] = node
-        unvisited.remove(node)
-
-    def get_new_current(self, unvisited, distance):
-        node = None
-        min_dist = 999999999
-        for n in unvisited:
-            if distance[n] < min_dist:
-                min_dist = distance[n]
-                node = n
-        return node
-
-    def shortest_path(self, nodes, start_node):
-        unvisited = set(nodes)
-        distance = dict()
-        for n in nodes:
-            distance[n] = 999999999
-        distance[start_node] = 0
-
-        prev = dict()
-        while self.get_end(nodes) in unvisited:
-            node = self.get_new_current(unvisited, distance)
-            if node is None:
-                break
-            self.visit(node, unvisited, distance, prev)
-
-        return prev
-
-    def get_path(self, nodes, prev):
-        path = []
-        node = self.get_end(nodes)
-        while node in prev:
-            path.append(node)
-            node = prev[node]
-            if node not in prev:
-                path.append(node)
+        return HeightMap(self.get_data(self.get_day(), data_file_path))
 
-        return list(reversed(path))
+    def solve_part_1(self, data: HeightMap) -> int:
+        return data.bfs([data.start]).distances[data.end]
 
-    def solve_part_1(self, data: Any) -> int:
-        # return 0
-        self.data = data
-        nodes = self.build_graph()
-        prev = self.shortest_path(nodes, self.get_start(nodes))
-        path = self.get_path(nodes, prev)
-
-        return len(path) - 1
-
-    def solve_part_2(self, data: Any) -> int:
-        self.data = data
-        min_steps = 999999999
-        nodes = self.build_graph()
-        start_nodes = self.get_all_starts(nodes)
-        for start_node in start_nodes:
-            nodes = self.build_graph()
-            prev = self.shortest_path(nodes, start_node)
-            path = self.get_path(nodes, prev)
-            if len(path) > 0:
-                if len(path) - 1 < min_steps:
-                    min_steps = len(path) - 1
-
-        return min_steps
+    def solve_part_2(self, data: HeightMap) -> int:
+        # One search back from the end gives the distance from every square.
+        distances = data.bfs([data.end], reverse=True).distances
+        return min(distances[start] for start in data.get_lowest()
+                   if distances[start] != UNREACHED)
 
     def get_day(self) -> str:
         return os.path.basename(__file__)[3:5]
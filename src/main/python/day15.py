@@ -7,11 +7,14 @@ https://adventofcode.com/2022/day/15
 import os.path
 import re
 from collections import namedtuple
-from functools import reduce, cache
-from typing import Any
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
 
+from src.main.python.intervals import Interval, IntervalSet
 from src.main.python.util import AbstractSolver
 
+if TYPE_CHECKING:
+    import numpy as np
+
 INFINITY = 999999999
 
 Point = namedtuple('Point', 'x y')
@@ -28,28 +31,158 @@ class Sensor:
     def __init__(self, location: Point, beacon: Beacon = None) -> None:
         self.location = location
         self.beacon = beacon
+        # The radius never changes, so it is computed once here rather than
+        # cached per call, which kept every sensor and row alive.
+        self.radius = 0
+        if beacon is not None:
+            self.radius = self.taxi_distance(beacon.location)
 
-    @cache
     def beacon_distance(self) -> int:
-        return self.taxi_distance(self.beacon.location)
+        return self.radius
 
     def taxi_distance(self, p: Point) -> int:
         return abs(self.location.x - p.x) + abs(self.location.y - p.y)
 
-    @cache
     def excluded_x_interval(self, y: int) -> tuple[int, int] | None:
-        if (self.beacon_distance() - abs(y - self.location.y)) < 0:
+        half_width = self.radius - abs(y - self.location.y)
+        if half_width < 0:
             return None
-        x1 = self.location.x - (
-                self.beacon_distance() - abs(y - self.location.y))
-        x2 = self.location.x + (
-                self.beacon_distance() - abs(y - self.location.y))
-        return min(x1, x2), max(x1, x2)
+        return self.location.x - half_width, self.location.x + half_width
 
     def is_in_exclusion_zone(self, p: Point):
         return self.taxi_distance(p) <= self.beacon_distance()
 
 
+class RowCoverage:
+    """
+    Answer coverage questions for many rows at once with NumPy.
+
+    The interval every sensor covers on every queried row is computed by
+    broadcasting the rows against the sensor arrays. Sorting each row's
+    intervals by start and taking the running maximum of their ends then
+    merges them without a Python loop. Rows are processed in chunks sized so
+    the temporary arrays of a chunk take about CHUNK_BYTES, whatever the
+    number of rows or sensors.
+    """
+    CHUNK_BYTES = 64 * 1024 * 1024
+    # The number of int64 values merge and the kernels keep alive per row
+    # and sensor at their peak, measured with tracemalloc.
+    VALUES_PER_CELL = 8
+
+    def __init__(self, sensors: list[Sensor]) -> None:
+        """
+        Create a new RowCoverage.
+
+        Args:
+            sensors: The sensors. There must be at least one.
+        """
+        import numpy
+
+        self.np = np = numpy
+        self.xs = np.array([s.location.x for s in sensors], dtype=np.int64)
+        self.ys = np.array([s.location.y for s in sensors], dtype=np.int64)
+        self.radii = np.array([s.radius for s in sensors], dtype=np.int64)
+        self.empty = np.iinfo(np.int64).max // 4
+        self.chunk_rows = max(1, self.CHUNK_BYTES // (
+                self.VALUES_PER_CELL * np.dtype(np.int64).itemsize
+                * len(self.xs)))
+
+    def merge(self, rows: 'np.ndarray', low: int = None,
+              high: int = None) -> tuple['np.ndarray', ...]:
+        """
+        Find every sensor's interval on each row, sorted by start.
+
+        Args:
+            rows: The rows.
+            low: Clip the intervals to start at or after this x.
+            high: Clip the intervals to end at or before this x.
+
+        Returns:
+            The starts, the ends, and the furthest end reached by each
+            interval and the ones before it, one row per queried row. Empty
+            intervals sort last and cover nothing.
+        """
+        np = self.np
+        half_widths = self.radii - np.abs(rows[:, None] - self.ys)
+        starts = self.xs - half_widths
+        ends = self.xs + half_widths
+        if low is not None:
+            starts = np.maximum(starts, low)
+        if high is not None:
+            ends = np.minimum(ends, high)
+        empty = starts > ends
+        starts[empty] = self.empty
+        ends[empty] = self.empty - 1
+
+        order = np.argsort(starts, axis=1)
+        starts = np.take_along_axis(starts, order, axis=1)
+        ends = np.take_along_axis(ends, order, axis=1)
+        return starts, ends, np.maximum.accumulate(ends, axis=1)
+
+    def map_chunks(self, rows: Sequence[int],
+                   kernel: Callable[['np.ndarray'], 'np.ndarray']
+                   ) -> 'np.ndarray':
+        np, size = self.np, self.chunk_rows
+        rows = np.asarray(rows, dtype=np.int64)
+        result = np.empty(len(rows), dtype=np.int64)
+        for i in range(0, len(rows), size):
+            result[i:i + size] = kernel(rows[i:i + size])
+        return result
+
+    def lengths(self, rows: Sequence[int], low: int = None,
+                high: int = None) -> 'np.ndarray':
+        """
+        Count the positions at least one sensor covers on each row.
+
+        Args:
+            rows: The rows.
+            low: Only count positions at or after this x.
+            high: Only count positions at or before this x.
+
+        Returns:
+            The number of covered positions on each row.
+        """
+        np = self.np
+
+        def kernel(chunk):
+            starts, ends, reach = self.merge(chunk, low, high)
+            previous = np.concatenate(
+                    (np.full((len(chunk), 1), -self.empty), reach[:, :-1]),
+                    axis=1)
+            new_starts = np.maximum(starts, previous + 1)
+            return np.maximum(ends - new_starts + 1, 0).sum(axis=1)
+
+        return self.map_chunks(rows, kernel)
+
+    def first_gaps(self, rows: Sequence[int], low: int,
+                   high: int) -> 'np.ndarray':
+        """
+        Find the first position between low and high, inclusive, that no
+        sensor covers on each row.
+
+        Args:
+            rows: The rows.
+            low: The lowest x to consider.
+            high: The highest x to consider.
+
+        Returns:
+            The x of the first uncovered position on each row, or -1 for
+            rows that are covered from low to high.
+        """
+        np = self.np
+
+        def kernel(chunk):
+            starts, ends, reach = self.merge(chunk, low, high)
+            previous = np.concatenate(
+                    (np.full((len(chunk), 1), low - 1), reach[:, :-1]),
+                    axis=1)
+            gaps = np.where(starts > previous + 1, previous + 1, self.empty)
+            first = np.minimum(gaps.min(axis=1), reach[:, -1] + 1)
+            return np.where(first <= high, first, -1)
+
+        return self.map_chunks(rows, kernel)
+
+
 class Solver(AbstractSolver):
     def __init__(self, row: int = 2000000, max_xy: int = 4000000) -> None:
         super().__init__()
@@ -62,6 +195,9 @@ class Solver(AbstractSolver):
         self.beacon_points = []
         self.sensor_points = []
 
+    def get_parameters(self) -> dict[str, Any]:
+        return {'row': self.row, 'max_xy': self.max_xy}
+
     def init_data(self, data_file_path: str = None) -> Any:
         data = self.get_data(self.get_day(), data_file_path)
         pattern = r'Sensor at x=([-\d]+), y=([-\d]+): closest beacon is ' \
@@ -86,69 +222,88 @@ class Solver(AbstractSolver):
         return sensors
 
     @staticmethod
-    def current_contains_next(current_interval, next_interval):
-        return current_interval[0] <= next_interval[0] and \
-            current_interval[1] >= next_interval[1]
-
-    @staticmethod
-    def next_contains_current(current_interval, next_interval):
-        return next_interval[0] <= current_interval[0] and \
-            next_interval[1] >= current_interval[1]
-
-    @staticmethod
-    def next_extends_current(current_interval, next_interval):
-        return next_interval[0] <= current_interval[1] + 1 <= next_interval[1]
-
-    def collapse_intervals(self, excluded_x_intervals):
-        if not excluded_x_intervals:
-            return []
-        collapsed_intervals = []
-        ordered_excluded_intervals = sorted(excluded_x_intervals)
-        current_interval = ordered_excluded_intervals[0]
-        for next_interval in ordered_excluded_intervals[1:]:
-            if self.current_contains_next(current_interval, next_interval):
-                continue
-            elif self.next_contains_current(current_interval, next_interval):
-                current_interval = next_interval
-                continue
-            elif self.next_extends_current(current_interval, next_interval):
-                current_interval = current_interval[0], next_interval[1]
-            else:
-                collapsed_intervals.append(current_interval)
-                current_interval = next_interval
-        collapsed_intervals.append(current_interval)
-        return collapsed_intervals
+    def collapse_intervals(intervals: Iterable[tuple[int, int]]
+                           ) -> list[Interval]:
+        return list(IntervalSet(intervals))
 
     def solve_part_1(self, sensors: Any) -> int:
-        excluded_x_intervals = []
-        for sensor in sensors:
-            interval = sensor.excluded_x_interval(self.row)
-            if interval is not None:
-                excluded_x_intervals.append(interval)
+        excluded = IntervalSet(i for i in (s.excluded_x_interval(self.row)
+                                           for s in sensors)
+                               if i is not None)
+        # A position with a beacon on it can still hold a beacon.
+        beacons = {b for b in self.beacon_points
+                   if b.y == self.row and b.x in excluded}
+        return excluded.coverage() - len(beacons)
 
-        collapsed_intervals = self.collapse_intervals(excluded_x_intervals)
-        return reduce(lambda a, b: a + (b[1] - b[0]), collapsed_intervals, 0)
+    @staticmethod
+    def find_gap(covered: IntervalSet, low: int, high: int,
+                 parity: int) -> int | None:
+        """
+        Find the lowest value between low and high, inclusive, with the given
+        parity that is not covered.
+
+        Args:
+            covered: The covered values.
+            low: The lowest value to consider.
+            high: The highest value to consider.
+            parity: 0 for even values, 1 for odd values.
+
+        Returns:
+            The value, or None if there is none.
+        """
+        for gap in covered.gaps(low, high):
+            value = gap.low + (gap.low - parity) % 2
+            if value <= gap.high:
+                return value
+        return None
+
+    def find_uncovered_on_line(self, squares: list[tuple[int, int, int]],
+                               axis: int, value: int) -> Point | None:
+        """
+        Search one rotated line for a position in the search area that no
+        sensor covers.
+
+        Args:
+            squares: The range of each sensor in rotated coordinates, as
+                (x + y, x - y, beacon distance).
+            axis: 0 to search the line x + y = value, 1 to search the line
+                x - y = value.
+            value: The value of x + y or x - y along the line.
+
+        Returns:
+            The position, or None if the line is covered.
+        """
+        other = 1 - axis
+        covered = IntervalSet((s[other] - s[2], s[other] + s[2])
+                              for s in squares
+                              if abs(value - s[axis]) <= s[2])
+        m = self.max_xy
+        if axis == 0:
+            low, high = max(-value, value - 2 * m), min(value, 2 * m - value)
+        else:
+            low, high = max(-value, value), min(2 * m - value, 2 * m + value)
+        other_value = self.find_gap(covered, low, high, value % 2)
+        if other_value is None:
+            return None
+        a, b = (value, other_value) if axis == 0 else (other_value, value)
+        return Point((a + b) // 2, (a - b) // 2)
 
     def solve_part_2(self, sensors: Any) -> int:
-        collapsed_intervals = dict()
-        intervals = []
-        y = 0
-        for y in range(self.max_xy + 1):
-            excluded_x_intervals = []
-            for sensor in sensors:
-                interval = sensor.excluded_x_interval(y)
-                if interval:
-                    if interval[0] < 0:
-                        interval = 0, interval[1]
-                    if interval[1] > self.max_xy:
-                        interval = interval[0], self.max_xy
-                    excluded_x_intervals.append(interval)
-
-            intervals = self.collapse_intervals(excluded_x_intervals)
-            if len(intervals) == 2:
-                break
-
-        return ((intervals[0][1] + 1) * 4000000) + y
+        # Rotating by 45 degrees, a = x + y and b = x - y, turns each
+        # sensor's diamond into the square |a - as| <= r, |b - bs| <= r. The
+        # one uncovered position has a covered neighbor, so it lies just
+        # outside some sensor's range, on one of the lines a = as +/- (r + 1)
+        # or b = bs +/- (r + 1). Only those few lines are searched.
+        squares = [(s.location.x + s.location.y, s.location.x - s.location.y,
+                    s.radius) for s in sensors]
+        for axis in (0, 1):
+            lines = sorted({s[axis] + sign * (s[2] + 1)
+                            for s in squares for sign in (-1, 1)})
+            for value in lines:
+                p = self.find_uncovered_on_line(squares, axis, value)
+                if p is not None:
+                    return p.x * 4000000 + p.y
+        raise RuntimeError('Every position in the search area is covered')
 
     def get_day(self) -> str:
         return os.path.basename(__file__)[3:5]
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Generate valid puzzle data of any size for the implemented days.
+
+The same day, size, and seed always produce the same data. What size
+means depends on the day; see the docstring of each generator.
+"""
+import argparse
+import json
+import random
+import string
+import sys
+from typing import Any, Callable
+
+
+def generate_day01(size: int, rng: random.Random) -> list[str]:
+    """
+    Calorie counts. Size is the number of elves.
+    """
+    lines = []
+    for i in range(size):
+        if i > 0:
+            lines.append('')
+        lines.extend(str(rng.randint(1000, 9999))
+                     for _ in range(rng.randint(1, 15)))
+    return lines
+
+
+def generate_day02(size: int, rng: random.Random) -> list[str]:
+    """
+    A rock paper scissors strategy guide. Size is the number of rounds.
+    """
+    return [f'{rng.choice("ABC")} {rng.choice("XYZ")}' for _ in range(size)]
+
+
+def generate_rucksack(pool: list[str], badge: str,
+                      rng: random.Random) -> str:
+    shared = rng.choice(pool + [badge])
+    others = [x for x in pool if x != shared]
+    left_pool = others[:len(others) // 2]
+    right_pool = others[len(others) // 2:]
+
+    half_size = rng.randint(2, 16)
+    left = [shared] if shared == badge else [shared, badge]
+    left += rng.choices(left_pool, k=half_size - len(left))
+    right = [shared] + rng.choices(right_pool, k=half_size - 1)
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return ''.join(left + right)
+
+
+def generate_day03(size: int, rng: random.Random) -> list[str]:
+    """
+    Rucksack contents. Size is the number of groups of three elves.
+
+    Each group gets a badge item type and three disjoint pools of other
+    item types, so the badge is the only type all three carry. Each
+    rucksack splits its pool between its two compartments so exactly one
+    type is in both.
+    """
+    lines = []
+    for _ in range(size):
+        badge = rng.choice(string.ascii_letters)
+        others = [x for x in string.ascii_letters if x != badge]
+        rng.shuffle(others)
+        pool_size = len(others) // 3
+        for i in range(3):
+            pool = others[i * pool_size:(i + 1) * pool_size]
+            lines.append(generate_rucksack(pool, badge, rng))
+    return lines
+
+
+def generate_day04(size: int, rng: random.Random) -> list[str]:
+    """
+    Section assignment pairs. Size is the number of pairs.
+    """
+    lines = []
+    for _ in range(size):
+        a = rng.randint(1, 99)
+        b = rng.randint(a, 99)
+        c = rng.randint(1, 99)
+        d = rng.randint(c, 99)
+        lines.append(f'{a}-{b},{c}-{d}')
+    return lines
+
+
+def generate_day05(size: int, rng: random.Random) -> list[str]:
+    """
+    Crate stacks and a rearrangement procedure. Size is the number of
+    moves.
+
+    There are always nine stacks, which is what the drawing format allows.
+    Every move takes at most as many crates as its source stack holds.
+    """
+    stack_count = 9
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(1, 8))
+              for _ in range(stack_count)]
+
+    lines = []
+    for level in range(max(len(x) for x in stacks) - 1, -1, -1):
+        lines.append(' '.join(f'[{x[level]}]' if len(x) > level else '   '
+                              for x in stacks))
+    lines.append(' ' + '   '.join(str(i + 1) for i in range(stack_count))
+                 + ' ')
+    lines.append('')
+
+    for _ in range(size):
+        src = rng.choice([i for i, x in enumerate(stacks) if x])
+        dst = rng.choice([i for i in range(stack_count) if i != src])
+        qty = rng.randint(1, len(stacks[src]))
+        stacks[dst].extend(stacks[src][-qty:])
+        del stacks[src][-qty:]
+        lines.append(f'move {qty} from {src + 1} to {dst + 1}')
+    return lines
+
+
+def generate_day06(size: int, rng: random.Random) -> list[str]:
+    """
+    A datastream. Size is its length, at least 31.
+
+    The noise uses only three letters, so neither marker can appear before
+    the run of 14 distinct letters near the end.
+    """
+    noise = 'abc'
+    marker = rng.sample(string.ascii_lowercase[len(noise):], 14)
+    tail = rng.choices(noise, k=16)
+    head = rng.choices(noise, k=max(size, 31) - len(marker) - len(tail))
+    return [''.join(head + marker + tail)]
+
+
+def random_tree(size: int,
+                rng: random.Random) -> tuple[list[int], list[str]]:
+    """
+    A random tree of directory names. Node 0 is /, and every other node has
+    a parent with a lower index and a name unique among its siblings.
+
+    Returns:
+        The parent and the name of each node. / has no parent.
+    """
+    parents = [-1]
+    names = ['/']
+    children = [set() for _ in range(size + 1)]
+    for i in range(1, size + 1):
+        parent = rng.randrange(i)
+        name = ''.join(rng.choices(string.ascii_lowercase,
+                                   k=rng.randint(3, 8)))
+        while name in children[parent]:
+            name += rng.choice(string.ascii_lowercase)
+        parents.append(parent)
+        names.append(name)
+        children[parent].add(name)
+    return parents, names
+
+
+def split_total(total: int, count: int, rng: random.Random) -> list[int]:
+    """
+    Split a total into count random positive parts.
+    """
+    cuts = sorted(rng.sample(range(1, total), count - 1))
+    return [b - a for a, b in zip([0] + cuts, cuts + [total])]
+
+
+def terminal_transcript(children: list[list[int]], names: list[str],
+                        files: list[list[int]]) -> list[str]:
+    """
+    The commands and output of a walk through a directory tree that lists
+    every directory once, starting from /.
+    """
+    lines = []
+
+    def visit(node: int) -> None:
+        lines.append('$ ls')
+        for child in children[node]:
+            lines.append(f'dir {names[child]}')
+        for i, file_size in enumerate(files[node]):
+            lines.append(f'{file_size} file{i}.dat')
+        for child in children[node]:
+            lines.append(f'$ cd {names[child]}')
+            visit(child)
+            lines.append('$ cd ..')
+
+    lines.append('$ cd /')
+    visit(0)
+    return lines
+
+
+def generate_day07(size: int, rng: random.Random) -> list[str]:
+    """
+    A terminal transcript. Size is the number of directories below /.
+
+    The directories below / hold 30,000,000 to 40,000,000 bytes. Files in /
+    bring the total past 40,000,000 bytes, but by no more than the size of
+    the largest directory below /, so part 2 has to search for a directory
+    to delete and always finds one.
+    """
+    if size < 1:
+        raise ValueError('Day 7 needs at least one directory below /')
+    parents, names = random_tree(size, rng)
+    counts = [0] + [rng.randint(0, 4) for _ in range(size)]
+    counts[rng.randint(1, size)] += 1
+    sizes = iter(split_total(rng.randint(30_000_000, 40_000_000),
+                             sum(counts), rng))
+    files = [[next(sizes) for _ in range(count)] for count in counts]
+
+    totals = [sum(node_files) for node_files in files]
+    children = [[] for _ in range(size + 1)]
+    for i in range(size, 0, -1):
+        totals[parents[i]] += totals[i]
+        children[parents[i]].insert(0, i)
+    used = rng.randint(40_000_001, 40_000_000 + min(max(totals[1:]),
+                                                    29_999_999))
+    files[0] = split_total(used - totals[0],
+                           min(rng.randint(1, 4), used - totals[0]), rng)
+
+    return terminal_transcript(children, names, files)
+
+
+def generate_day08(size: int, rng: random.Random) -> list[str]:
+    """
+    A grove of tree heights. Size is the side of the square grid.
+    """
+    return [''.join(rng.choices(string.digits, k=size)) for _ in range(size)]
+
+
+def generate_day09(size: int, rng: random.Random) -> list[str]:
+    """
+    Rope head motions. Size is the number of motions.
+    """
+    return [f'{rng.choice("UDLR")} {rng.randint(1, 19)}' for _ in range(size)]
+
+
+def generate_day10(size: int, rng: random.Random) -> list[str]:
+    """
+    A CPU program. Size is the maximum number of instructions.
+
+    The CRT only has 240 pixels, one per cycle, so the program stops when it
+    reaches 240 cycles no matter the size.
+    """
+    lines = []
+    cycles = 0
+    while len(lines) < size and cycles < 240:
+        if cycles < 239 and rng.random() < 0.6:
+            lines.append(f'addx {rng.randint(-5, 5)}')
+            cycles += 2
+        else:
+            lines.append('noop')
+            cycles += 1
+    return lines
+
+
+def generate_day11(size: int, rng: random.Random) -> list[str]:
+    """
+    Monkey notes. Size is the number of items each monkey starts with.
+
+    There are always eight monkeys, since the notes only allow single-digit
+    monkey numbers, and each one tests for a different prime.
+    """
+    monkey_count = 8
+    primes = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], monkey_count)
+    square = rng.randrange(monkey_count)
+    lines = []
+    for i in range(monkey_count):
+        if i == square:
+            operation = 'old * old'
+        else:
+            operation = f'old {rng.choice("*+")} {rng.randint(2, 9)}'
+        targets = rng.sample([x for x in range(monkey_count) if x != i], 2)
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(size))
+        if i > 0:
+            lines.append('')
+        lines += [f'Monkey {i}:',
+                  f'  Starting items: {items}',
+                  f'  Operation: new = {operation}',
+                  f'  Test: divisible by {primes[i]}',
+                  f'    If true: throw to monkey {targets[0]}',
+                  f'    If false: throw to monkey {targets[1]}']
+    return lines
+
+
+def generate_day12(size: int, rng: random.Random) -> list[str]:
+    """
+    A heightmap. Size is the number of rows, at least 9; there are twice as
+    many columns.
+
+    Elevation grows with the distance from S in the top left corner, plus
+    row and column noise, scaled so neighbors never differ by more than 1.
+    Every cell is reachable and E, in the bottom right corner, is at 'z'.
+    """
+    if size < 9:
+        raise ValueError('Day 12 needs at least 9 rows')
+    rows = size
+    cols = 2 * size
+    step = (rows + cols - 2) // 25
+
+    def walk(length: int) -> list[int]:
+        values = [0]
+        for _ in range(length - 1):
+            values.append(max(0, values[-1] + rng.choice((-1, 0, 1))))
+        return values
+
+    row_noise = walk(rows) if step > 1 else [0] * rows
+    col_noise = walk(cols) if step > 1 else [0] * cols
+    lines = []
+    for r in range(rows):
+        line = []
+        for c in range(cols):
+            height = min(25, (r + c + row_noise[r] + col_noise[c]) // step)
+            line.append(chr(ord('a') + height))
+        lines.append(''.join(line))
+    lines[0] = 'S' + lines[0][1:]
+    lines[-1] = lines[-1][:-1] + 'E'
+    return lines
+
+
+def random_packet(rng: random.Random, depth: int = 0) -> Any:
+    if depth > 0 and rng.random() < 0.6:
+        return rng.randint(0, 10)
+    if depth >= 3:
+        return []
+    return [random_packet(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+
+
+def generate_day13(size: int, rng: random.Random) -> list[str]:
+    """
+    Distress signal packets. Size is the number of packet pairs.
+    """
+    lines = []
+    for i in range(size):
+        if i > 0:
+            lines.append('')
+        for _ in range(2):
+            lines.append(json.dumps(random_packet(rng), separators=(',', ':')))
+    return lines
+
+
+def generate_day14(size: int, rng: random.Random) -> list[str]:
+    """
+    Rock paths. Size is the number of paths.
+
+    Paths stay at most 400 units deep and cluster around x=500, below the
+    sand source. One path always reaches far enough to the right that the
+    cave is wide enough for the part 2 floor.
+    """
+    depth = min(10 + size, 400)
+    width = depth + 10
+    lines = []
+    for i in range(size):
+        if i == 0:
+            x = 500 + width
+        else:
+            x = min(500 + width, max(500 - width,
+                                     round(rng.gauss(500, width / 4))))
+        y = rng.randint(2, depth)
+        points = [(x, y)]
+        for j in range(rng.randint(1, 4)):
+            if j % 2 == 0:
+                x = min(500 + width, max(500 - width,
+                                         x + (rng.randint(-8, 8) or 1)))
+            else:
+                y = min(depth, max(2, y + (rng.randint(-8, 8) or 1)))
+            points.append((x, y))
+        lines.append(' -> '.join(f'{x},{y}' for x, y in points))
+    return lines
+
+
+def generate_day15(size: int, rng: random.Random) -> list[str]:
+    """
+    Sensor reports. Size is the number of sensors, at least 4.
+
+    The data matches the default row and search area of the day 15 Solver.
+    One hidden point is the only position in the search area no sensor
+    covers: every sensor's beacon is closer to the sensor than the hidden
+    point is, and the sensors in the four corners of the search area
+    together cover everything else.
+    """
+    max_xy = 4000000
+    hidden = (rng.randint(1, max_xy - 1), rng.randint(1, max_xy - 1))
+    sensors = [(0, 0), (0, max_xy), (max_xy, 0), (max_xy, max_xy)]
+    while len(sensors) < max(size, 4):
+        sensor = (rng.randint(0, max_xy), rng.randint(0, max_xy))
+        if abs(sensor[0] - hidden[0]) + abs(sensor[1] - hidden[1]) > 1:
+            sensors.append(sensor)
+
+    lines = []
+    for i, (x, y) in enumerate(sensors):
+        distance = abs(x - hidden[0]) + abs(y - hidden[1])
+        radius = distance - 1 if i < 4 else rng.randint(distance // 2,
+                                                        distance - 1)
+        dx = rng.randint(-radius, radius)
+        dy = rng.choice((-1, 1)) * (radius - abs(dx))
+        lines.append(f'Sensor at x={x}, y={y}: closest beacon is at '
+                     f'x={x + dx}, y={y + dy}')
+    return lines
+
+
+def generate_day16(size: int, rng: random.Random) -> list[str]:
+    """
+    A scan of valves and tunnels. Size is the number of valves, at least 2.
+
+    The tunnels connect every valve to AA. About 60% of the valves,
+    including AA, have a flow rate of zero.
+    """
+    size = min(max(size, 2), 26 * 26)
+    names = ['AA'] + rng.sample([a + b for a in string.ascii_uppercase
+                                 for b in string.ascii_uppercase
+                                 if a + b != 'AA'], size - 1)
+
+    tunnels = {name: set() for name in names}
+    for i in range(1, size):
+        other = names[rng.randrange(i)]
+        tunnels[names[i]].add(other)
+        tunnels[other].add(names[i])
+    for _ in range(size // 3):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    lines = []
+    for name in names:
+        rate = 0 if name == 'AA' or rng.random() < 0.6 else rng.randint(1, 25)
+        others = sorted(tunnels[name])
+        if len(others) == 1:
+            lines.append(f'Valve {name} has flow rate={rate}; '
+                         f'tunnel leads to valve {others[0]}')
+        else:
+            lines.append(f'Valve {name} has flow rate={rate}; '
+                         f'tunnels lead to valves {", ".join(others)}')
+    return lines
+
+
+GENERATORS: dict[str, Callable[[int, random.Random], list[str]]] = {
+    '01': generate_day01,
+    '02': generate_day02,
+    '03': generate_day03,
+    '04': generate_day04,
+    '05': generate_day05,
+    '06': generate_day06,
+    '07': generate_day07,
+    '08': generate_day08,
+    '09': generate_day09,
+    '10': generate_day10,
+    '11': generate_day11,
+    '12': generate_day12,
+    '13': generate_day13,
+    '14': generate_day14,
+    '15': generate_day15,
+    '16': generate_day16,
+}
+
+
+def generate(day: str, size: int, seed: int = 0) -> list[str]:
+    """
+    Generate puzzle data.
+
+    Args:
+        day: The day, as a two-digit string.
+        size: The size of the data. What it means depends on the day.
+        seed: The random seed.
+
+    Returns:
+        The lines of the data file.
+    """
+    if day not in GENERATORS:
+        raise RuntimeError(f'No generator for day {day}')
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write(day: str, size: int, path: str, seed: int = 0) -> None:
+    """
+    Generate puzzle data and write it to a file.
+
+    Args:
+        day: The day, as a two-digit string.
+        size: The size of the data. What it means depends on the day.
+        path: The path to write the data file to.
+        seed: The random seed.
+    """
+    with open(path, 'w') as data_file:
+        data_file.write('\n'.join(generate(day, size, seed)) + '\n')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip(),
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('day', type=int, help='day to generate data for')
+    parser.add_argument('size', type=int, help='size of the data')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='random seed (default: 0)')
+    parser.add_argument('-o', '--output',
+                        help='file to write (default: standard output)')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    day = f'{args.day:02d}'
+    if args.output:
+        write(day, args.size, args.output, args.seed)
+    else:
+        sys.stdout.write('\n'.join(generate(day, args.size, args.seed)) + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure how long it takes to import a module in a fresh interpreter.
+
+This runs python -X importtime in a subprocess, so modules the caller has
+already imported do not hide their cost.
+"""
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+IMPORT_TIME_PATTERN = re.compile(
+        r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+@dataclass
+class ImportTime:
+    """
+    The cumulative time to import a module, and the modules it imported
+    that took the most time themselves.
+    """
+    module: str
+    cumulative: float
+    slowest: list[tuple[str, float]]
+
+
+def parse_import_time(module_name: str, output: str,
+                      top: int = 5) -> ImportTime:
+    """
+    Parse the output of python -X importtime.
+
+    Each line gives the time a module took by itself and including the
+    modules it imported. A module's line follows the lines of the modules it
+    imported, which are indented further.
+
+    Args:
+        module_name: The module that was imported.
+        output: The standard error of the interpreter.
+        top: The number of slowest modules to keep.
+
+    Returns:
+        The import time, in seconds.
+    """
+    subtree = []
+    for line in output.splitlines():
+        m = IMPORT_TIME_PATTERN.match(line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = m.groups()
+        if name == module_name and not indent:
+            slowest = sorted(subtree + [(name, int(self_us) / 1e6)],
+                             key=lambda x: x[1], reverse=True)
+            return ImportTime(module_name, int(cumulative_us) / 1e6,
+                              slowest[:top])
+        if indent:
+            subtree.append((name, int(self_us) / 1e6))
+        else:
+            subtree = []
+    raise RuntimeError(f'No import time for {module_name}')
+
+
+def measure_import_time(module_name: str, repeat: int = 1,
+                        top: int = 5) -> ImportTime:
+    """
+    Import a module in a fresh interpreter and time it.
+
+    Args:
+        module_name: The module to import.
+        repeat: The number of fresh interpreters. The fastest import is
+            kept, since slower ones only add noise from the rest of the
+            system.
+        top: The number of slowest modules to keep.
+
+    Returns:
+        The import time, in seconds.
+    """
+    fastest = None
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                                    f'import {module_name}'],
+                                   capture_output=True, text=True, check=True)
+        import_time = parse_import_time(module_name, completed.stderr, top)
+        if fastest is None or import_time.cumulative < fastest.cumulative:
+            fastest = import_time
+    return fastest
@@ -0,0 +1,130 @@
+"""
+Closed integer intervals and sets of them.
+
+An IntervalSet keeps its intervals sorted, disjoint, and merged with their
+neighbors, in two parallel lists of lows and highs. Every query is a binary
+search with bisect. Adding an interval is a binary search plus one slice
+assignment that replaces the intervals it merges with. The slice assignment
+shifts the intervals after it, so add is O(n) in the number of intervals,
+although the shift is a single memory move. Building a set from many
+intervals at once sorts them first and never shifts anything.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, NamedTuple
+
+
+class Interval(NamedTuple):
+    """
+    The integers from low to high, inclusive.
+    """
+    low: int
+    high: int
+
+    def size(self) -> int:
+        return self.high - self.low + 1
+
+    def contains(self, value: int) -> bool:
+        return self.low <= value <= self.high
+
+    def covers(self, other: 'Interval') -> bool:
+        return self.low <= other.low and other.high <= self.high
+
+    def overlaps(self, other: 'Interval') -> bool:
+        return self.low <= other.high and other.low <= self.high
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint intervals. Intervals that
+    overlap or are adjacent are merged.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        """
+        Create a new IntervalSet.
+
+        Args:
+            intervals: The intervals to add, as Interval or (low, high)
+                pairs.
+        """
+        self.lows = []
+        self.highs = []
+        for low, high in sorted(intervals):
+            self.append(low, high)
+
+    def append(self, low: int, high: int) -> None:
+        # Adding intervals in order of their lows only ever touches the end.
+        if self.highs and low <= self.highs[-1] + 1:
+            self.highs[-1] = max(self.highs[-1], high)
+        else:
+            self.lows.append(low)
+            self.highs.append(high)
+
+    def add(self, low: int, high: int) -> None:
+        """
+        Add the integers from low to high, inclusive.
+
+        Finding the intervals to merge with is O(log n), but replacing them
+        shifts the intervals after them, which is O(n).
+
+        Args:
+            low: The lowest integer to add.
+            high: The highest integer to add.
+        """
+        # Intervals i to j - 1 overlap or touch the new one.
+        i = bisect_left(self.highs, low - 1)
+        j = bisect_right(self.lows, high + 1)
+        if i < j:
+            low = min(low, self.lows[i])
+            high = max(high, self.highs[j - 1])
+        self.lows[i:j] = [low]
+        self.highs[i:j] = [high]
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(Interval, self.lows, self.highs)
+
+    def __len__(self) -> int:
+        return len(self.lows)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.lows, value) - 1
+        return i >= 0 and value <= self.highs[i]
+
+    def coverage(self) -> int:
+        """
+        Count the integers in the set.
+
+        Returns:
+            The total size of the intervals.
+        """
+        return sum(self.highs) - sum(self.lows) + len(self.lows)
+
+    def covers(self, low: int, high: int) -> bool:
+        i = bisect_right(self.lows, low) - 1
+        return i >= 0 and high <= self.highs[i]
+
+    def overlaps(self, low: int, high: int) -> bool:
+        i = bisect_left(self.highs, low)
+        return i < len(self.lows) and self.lows[i] <= high
+
+    def gaps(self, low: int, high: int) -> Iterator[Interval]:
+        """
+        Find the ranges between low and high, inclusive, that are not in the
+        set.
+
+        Args:
+            low: The lowest integer to consider.
+            high: The highest integer to consider.
+
+        Returns:
+            The missing ranges, in order.
+        """
+        i = bisect_left(self.highs, low)
+        while low <= high:
+            if i == len(self.lows) or self.lows[i] > high:
+                yield Interval(low, high)
+                return
+            if self.lows[i] > low:
+                yield Interval(low, self.lows[i] - 1)
+            low = self.highs[i] + 1
+            i += 1
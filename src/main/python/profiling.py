@@ -0,0 +1,186 @@
+"""
+Profilers that wrap the solve step of one puzzle part.
+
+Each profiler is a context manager. Files it writes go to the directory
+named by the PROFILE_DIR_PATH environment variable, or build/profiles when
+that is not set. After the with block, report() summarizes what the
+profiler saw.
+"""
+import cProfile
+import io
+import os
+import pstats
+import signal
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from types import FrameType
+
+
+class Profiler(ABC):
+
+    def __init__(self, name: str) -> None:
+        """
+        Create a new Profiler.
+
+        Args:
+            name: The base name for files the profiler writes, for example
+                day12-part2.
+        """
+        self.name = name
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def report(self) -> str:
+        pass
+
+    def get_output_path(self, extension: str) -> str:
+        directory = os.environ.get('PROFILE_DIR_PATH',
+                                   os.path.join('build', 'profiles'))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f'{self.name}.{extension}')
+
+
+class CProfileProfiler(Profiler):
+    """
+    Trace every function call with cProfile and dump the stats to a .pstats
+    file.
+    """
+    TOP_FUNCTIONS = 15
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.profile = cProfile.Profile()
+        self.path = None
+
+    def start(self) -> None:
+        self.profile.enable()
+
+    def stop(self) -> None:
+        self.profile.disable()
+        self.path = self.get_output_path('pstats')
+        self.profile.dump_stats(self.path)
+
+    def report(self) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(self.TOP_FUNCTIONS)
+        return f'Profile written to {self.path}\n{stream.getvalue()}'
+
+
+class TracemallocProfiler(Profiler):
+    """
+    Trace memory allocations and report the peak and the top allocation
+    sites still alive at the end.
+    """
+    TOP_SITES = 10
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.peak = 0
+        self.snapshot = None
+
+    def start(self) -> None:
+        tracemalloc.start()
+
+    def stop(self) -> None:
+        self.snapshot = tracemalloc.take_snapshot()
+        _, self.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    def report(self) -> str:
+        lines = [f'Peak Memory: {self.peak / 1024:.1f} KiB',
+                 f'Top {self.TOP_SITES} allocation sites:']
+        for stat in self.snapshot.statistics('lineno')[:self.TOP_SITES]:
+            lines.append(f'    {stat}')
+        return '\n'.join(lines)
+
+
+class SamplingProfiler(Profiler):
+    """
+    Sample the call stack on a CPU-time interval timer and write the samples
+    as collapsed stacks, the input format for flame graph tools.
+
+    This relies on signal.setitimer, so it only works on Unix-like systems
+    and in the main thread.
+    """
+    INTERVAL_SECONDS = 0.001
+    TOP_STACKS = 10
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.samples = Counter()
+        self.previous_handler = None
+        self.path = None
+
+    def sample(self, signum: int, frame: FrameType) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f'{code.co_name} '
+                         f'({os.path.basename(code.co_filename)}'
+                         f':{code.co_firstlineno})')
+            frame = frame.f_back
+        self.samples[';'.join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self.previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.INTERVAL_SECONDS,
+                         self.INTERVAL_SECONDS)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+        self.path = self.get_output_path('collapsed')
+        with open(self.path, 'w') as collapsed_file:
+            for stack, count in self.samples.items():
+                collapsed_file.write(f'{stack} {count}\n')
+
+    def report(self) -> str:
+        total = sum(self.samples.values())
+        leaves = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        lines = [f'{total} samples written to {self.path}',
+                 f'Top {self.TOP_STACKS} functions by samples:']
+        for leaf, count in leaves.most_common(self.TOP_STACKS):
+            lines.append(f'    {count / total:6.1%}  {leaf}')
+        return '\n'.join(lines)
+
+
+PROFILERS = {
+    'cprofile': CProfileProfiler,
+    'tracemalloc': TracemallocProfiler,
+    'sampling': SamplingProfiler,
+}
+
+
+def get_profiler(kind: str, name: str) -> Profiler:
+    """
+    Create a profiler by kind.
+
+    Args:
+        kind: One of the keys of PROFILERS.
+        name: The base name for files the profiler writes.
+
+    Returns:
+        The new profiler.
+    """
+    if kind not in PROFILERS:
+        raise RuntimeError(f'Unknown profiler: {kind}')
+    return PROFILERS[kind](name)
@@ -0,0 +1,47 @@
+"""
+Find the daily puzzle solvers without importing them.
+
+Each day's solver is the Solver class in the module named dayNN.py in this
+package. Only file names are read, so discovering the days costs nothing
+and a day's module is imported only when that day is solved.
+"""
+import importlib
+import os
+import re
+
+from src.main.python.util import AbstractSolver
+
+PACKAGE = 'src.main.python'
+DAY_MODULE_PATTERN = re.compile(r'^day(\d\d)\.py$')
+SOLVER_CLASS = 'Solver'
+
+
+def find_days(directory: str = None) -> dict[str, str]:
+    """
+    Find the day modules in a directory.
+
+    Args:
+        directory: The directory to search. Defaults to this package.
+
+    Returns:
+        The module name for each day, keyed by day.
+    """
+    days = dict()
+    for file_name in os.listdir(directory or os.path.dirname(__file__)):
+        m = DAY_MODULE_PATTERN.match(file_name)
+        if m:
+            days[m.group(1)] = f'{PACKAGE}.{file_name[:-3]}'
+    return dict(sorted(days.items()))
+
+
+def load_solver(module_name: str) -> AbstractSolver:
+    """
+    Import a day module and create its solver.
+
+    Args:
+        module_name: The name of the day module.
+
+    Returns:
+        A new solver.
+    """
+    return getattr(importlib.import_module(module_name), SOLVER_CLASS)()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Store benchmark results and compare them across commits.
+
+Each benchmark result is appended as one JSON object per line to the
+results file. Compare the results for one commit with the results for a
+baseline commit to find parts that got slower.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+from src.main.python.util import BenchmarkResult, Timer, file_digest
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def get_results_file_path(results_file_path: str = None) -> str:
+    if results_file_path:
+        return results_file_path
+    return os.environ.get('RESULTS_FILE_PATH', 'results.jsonl')
+
+
+def git_commit(ref: str = 'HEAD') -> str:
+    """
+    Resolve a git reference to a full commit hash. Git runs in the directory
+    of this module, so the hash is that of the code being benchmarked no
+    matter where the command was started. Raises RuntimeError when git
+    cannot resolve the reference.
+
+    Args:
+        ref: The reference, for example a branch name or abbreviated hash.
+
+    Returns:
+        The full commit hash.
+    """
+    try:
+        completed = subprocess.run(
+                ['git', 'rev-parse', '--verify', '--quiet',
+                 f'{ref}^{{commit}}'],
+                capture_output=True, text=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError as e:
+        raise RuntimeError(f'Cannot run git: {e}')
+    if completed.returncode != 0:
+        raise RuntimeError(f'Not a commit: {ref}')
+    return completed.stdout.strip()
+
+
+def make_record(result: BenchmarkResult, data_file_path: str,
+                commit: str, implementation: str = None,
+                version: str = None) -> dict:
+    """
+    Convert a benchmark result into a results file record.
+
+    Args:
+        result: The benchmark result.
+        data_file_path: The path to the puzzle data the benchmark used.
+        commit: The commit hash of the code that was benchmarked.
+        implementation: The language implementation that ran the benchmark.
+            Defaults to this Python implementation.
+        version: The version of the implementation. Defaults to this Python
+            version.
+
+    Returns:
+        The record.
+    """
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'day': result.day,
+        'part': result.part,
+        'commit': commit,
+        'implementation': implementation or platform.python_implementation(),
+        'version': version or platform.python_version(),
+        'input_sha256': file_digest(data_file_path),
+        'warmup': result.warmup,
+        'gc_disabled': result.gc_disabled,
+        'parse': asdict(result.parse_stats),
+        'solve': asdict(result.solve_stats),
+    }
+
+
+def append_records(records: list[dict], results_file_path: str = None) -> None:
+    path = get_results_file_path(results_file_path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a') as results_file:
+        for record in records:
+            results_file.write(json.dumps(record) + '\n')
+
+
+def load_records(results_file_path: str = None) -> list[dict]:
+    path = get_results_file_path(results_file_path)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+@dataclass
+class Comparison:
+    """
+    The median solve times of one part for a baseline and a candidate.
+    """
+    day: str
+    part: int
+    baseline_median: float
+    candidate_median: float
+
+    def change(self) -> float:
+        if self.baseline_median == 0:
+            return 0.0
+        return self.candidate_median / self.baseline_median - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.change() > threshold
+
+
+def latest_by_part(records: list[dict], commit: str) -> dict[tuple, dict]:
+    """
+    Find the most recent record of each part for one commit.
+
+    Only records for the same input data and Python version are comparable,
+    so they are part of the key.
+
+    Args:
+        records: All records, oldest first.
+        commit: The commit hash.
+
+    Returns:
+        The latest record, keyed by day, part, input hash, implementation,
+        and version.
+    """
+    latest = dict()
+    for record in records:
+        if record['commit'] == commit:
+            key = (record['day'], record['part'], record['input_sha256'],
+                   record['implementation'], record['version'])
+            latest[key] = record
+    return latest
+
+
+def compare(records: list[dict], baseline: str,
+            candidate: str) -> list[Comparison]:
+    baseline_records = latest_by_part(records, baseline)
+    candidate_records = latest_by_part(records, candidate)
+    comparisons = []
+    for key in sorted(baseline_records.keys() & candidate_records.keys()):
+        comparisons.append(
+                Comparison(key[0], key[1],
+                           baseline_records[key]['solve']['median'],
+                           candidate_records[key]['solve']['median']))
+    return comparisons
+
+
+def print_comparisons(comparisons: list[Comparison],
+                      threshold: float) -> None:
+    print(f'{"Day":>3}  {"Part":>4}  {"Baseline Median":>20}  '
+          f'{"Candidate Median":>20}  {"Change":>8}')
+    for c in comparisons:
+        flag = '  REGRESSION' if c.is_regression(threshold) else ''
+        print(f'{c.day:>3}  {c.part:>4}  '
+              f'{Timer.format_seconds(c.baseline_median):>20}  '
+              f'{Timer.format_seconds(c.candidate_median):>20}  '
+              f'{c.change():>+8.1%}{flag}')
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip(),
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', help='baseline commit or reference')
+    parser.add_argument('-c', '--candidate', default='HEAD',
+                        help='candidate commit or reference (default: HEAD)')
+    parser.add_argument('-t', '--threshold', type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help='flag parts whose median solve time grew by '
+                             'more than this fraction (default: '
+                             f'{DEFAULT_THRESHOLD})')
+    parser.add_argument('-f', '--results-file',
+                        help='results file (default: $RESULTS_FILE_PATH)')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    records = load_records(args.results_file)
+    try:
+        baseline, candidate = git_commit(args.baseline), \
+            git_commit(args.candidate)
+    except RuntimeError as e:
+        print(e)
+        sys.exit(2)
+    comparisons = compare(records, baseline, candidate)
+    if not comparisons:
+        print(f'No comparable results for {args.baseline} and '
+              f'{args.candidate}')
+        sys.exit(2)
+
+    print_comparisons(comparisons, args.threshold)
+    if any(c.is_regression(args.threshold) for c in comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
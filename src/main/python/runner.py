@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Run any selection of daily puzzles and report the answers and timings.
+
+Every day/part pair runs in its own worker process, so slow parts like
+day 12 part 2 and day 15 part 2 run side by side instead of one after
+another. Only the modules of the selected days are imported.
+"""
+import argparse
+import contextlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+from src.main.python.importtime import ImportTime, measure_import_time
+from src.main.python.profiling import PROFILERS
+from src.main.python.registry import find_days, load_solver
+from src.main.python.util import AbstractSolver, BenchmarkResult, \
+    TimingStats, Timer
+
+PARTS = (1, 2)
+
+
+def int_at_least(value: str, minimum: int) -> int:
+    """
+    Parse a command line argument that must be an integer of at least some
+    minimum.
+
+    Args:
+        value: The argument.
+        minimum: The smallest allowed integer.
+
+    Returns:
+        The integer.
+    """
+    number = int(value)
+    if number < minimum:
+        raise argparse.ArgumentTypeError(
+                f'must be at least {minimum}: {value}')
+    return number
+
+
+def positive_int(value: str) -> int:
+    return int_at_least(value, 1)
+
+
+def non_negative_int(value: str) -> int:
+    return int_at_least(value, 0)
+
+
+def get_modules(days: list[str]) -> dict[str, str]:
+    """
+    Look up the modules of the selected days.
+
+    Args:
+        days: The days, as two-digit strings.
+
+    Returns:
+        The module name for each day, keyed by day.
+    """
+    modules = find_days()
+    unknown = [day for day in days if day not in modules]
+    if unknown:
+        raise RuntimeError(f'No solver for day(s): {", ".join(unknown)}')
+    return {day: modules[day] for day in days}
+
+
+def run_part(module_name: str, part: int, repeat: int,
+             warmup: int, disable_gc: bool, profiler: str = None,
+             parse_cache: bool = False,
+             answer_cache: bool = False) -> BenchmarkResult:
+    """
+    Solve one part of one day's puzzle. This runs in a worker process.
+
+    Anything the solver prints is discarded so it does not interleave with
+    the output of other workers.
+
+    Args:
+        module_name: The name of the day module.
+        part: The puzzle part to solve, 1 or 2.
+        repeat: The number of timed runs.
+        warmup: The number of untimed runs before the timed runs.
+        disable_gc: Disable the garbage collector during each run.
+        profiler: The kind of profiler for one extra, untimed run.
+        parse_cache: Load parsed data from the parse cache when possible.
+        answer_cache: Return answers from the answer cache when possible.
+
+    Returns:
+        The answer and timing statistics for the part.
+    """
+    from src.main.python.cache import AnswerCache, ParseCache
+
+    solver = load_solver(module_name)
+    data_file_path = solver.get_data_file_path(solver.get_day())
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solver.benchmark(part, data_file_path, repeat, warmup,
+                                disable_gc, profiler,
+                                ParseCache() if parse_cache else None,
+                                AnswerCache() if answer_cache else None)
+
+
+def run(days: list[str], parts: list[int], workers: int = None,
+        repeat: int = 1, warmup: int = 0, disable_gc: bool = False,
+        profiler: str = None, parse_cache: bool = False,
+        answer_cache: bool = False) -> list[BenchmarkResult]:
+    """
+    Solve the selected parts of the selected days in a process pool.
+
+    Args:
+        days: The days to run, as two-digit strings.
+        parts: The parts to run for each day.
+        workers: The maximum number of worker processes. Defaults to the
+            number of CPUs.
+        repeat: The number of timed runs of each part.
+        warmup: The number of untimed runs of each part before the timed
+            runs.
+        disable_gc: Disable the garbage collector during each run.
+        profiler: The kind of profiler for one extra, untimed run of each
+            part.
+        parse_cache: Load parsed data from the parse cache when possible.
+        answer_cache: Return answers from the answer cache when possible.
+
+    Returns:
+        A BenchmarkResult for each part, ordered by day and part. The answer
+        for a part that failed is the exception it raised, with no timings.
+    """
+    modules = get_modules(days)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_part, modules[day], part, repeat,
+                                   warmup, disable_gc, profiler,
+                                   parse_cache, answer_cache): (day, part)
+                   for day in days for part in parts}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(BenchmarkResult(*futures[future], e, None, None,
+                                               warmup, disable_gc))
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def record_results(results: list[BenchmarkResult]) -> None:
+    """
+    Append the results of the parts that were solved, not failed or
+    answered from the answer cache, to the results file.
+
+    Args:
+        results: The results to record.
+    """
+    from src.main.python.results import append_records, git_commit, \
+        make_record
+
+    commit = git_commit()
+    append_records([make_record(result,
+                                AbstractSolver.get_data_file_path(result.day),
+                                commit)
+                    for result in results
+                    if not isinstance(result.answer, Exception)
+                    and not result.cached])
+
+
+def format_answer(answer: Any) -> str:
+    text = str(answer).strip()
+    if '\n' in text:
+        return '\n' + text
+    return text
+
+
+def format_result(result: BenchmarkResult) -> str:
+    if isinstance(result.answer, Exception):
+        answer = f'Failed: {result.answer!r}'
+    else:
+        answer = format_answer(result.answer)
+    if result.cached:
+        answer += ' (cached)'
+    return answer
+
+
+def format_stat(stats: TimingStats | None, name: str) -> str:
+    if stats is None:
+        return '-'
+    return Timer.format_seconds(getattr(stats, name))
+
+
+def print_report(results: list[BenchmarkResult], timer: Timer,
+                 repeat: int = 1) -> None:
+    """
+    Print a table of answers and timings.
+
+    Times are medians. The p95 and standard deviation of the solve times are
+    included when each part ran more than once.
+
+    Args:
+        results: The results to report.
+        timer: The Timer for the whole run.
+        repeat: The number of timed runs of each part.
+    """
+    columns = [('Parse Time', 'parse_stats', 'median'),
+               ('Solve Time', 'solve_stats', 'median')]
+    if repeat > 1:
+        columns += [('Solve p95', 'solve_stats', 'p95'),
+                    ('Solve StdDev', 'solve_stats', 'stddev')]
+
+    print(f'{"Day":>3}  {"Part":>4}  '
+          + ''.join(f'{heading:>20}  ' for heading, _, _ in columns)
+          + 'Answer')
+    for result in results:
+        print(f'{result.day:>3}  {result.part:>4}  '
+              + ''.join(f'{format_stat(getattr(result, stats), name):>20}  '
+                        for _, stats, name in columns)
+              + format_result(result))
+    print(f'\nWall-Clock Time: {timer.elapsed_time()}')
+
+    for result in results:
+        if result.profile:
+            print(f'\nDay {result.day} Part {result.part} Profile\n'
+                  f'{result.profile}')
+
+
+def print_import_report(import_times: list[ImportTime],
+                        budget: float = None) -> None:
+    """
+    Print the import time of each module and the modules it imported that
+    took the most time themselves.
+
+    Args:
+        import_times: The import times to report.
+        budget: The import time in seconds above which a module is flagged.
+    """
+    print(f'{"Module":<24}  {"Import Time":>20}')
+    for import_time in import_times:
+        flag = ''
+        if budget is not None and import_time.cumulative > budget:
+            flag = '  OVER BUDGET'
+        print(f'{import_time.module:<24}  '
+              f'{Timer.format_seconds(import_time.cumulative):>20}{flag}')
+        for name, seconds in import_time.slowest:
+            print(f'    {Timer.format_seconds(seconds):>20}  {name}')
+
+
+def check_import_times(days: list[str], repeat: int = 1,
+                       budget: float = None) -> bool:
+    """
+    Time importing the module of each selected day in a fresh interpreter
+    and print a report.
+
+    Args:
+        days: The days to check, as two-digit strings.
+        repeat: The number of fresh interpreters per day. The fastest import
+            is reported.
+        budget: The import time in seconds that no module may exceed.
+
+    Returns:
+        False if a module took longer than the budget to import.
+    """
+    modules = get_modules(days)
+    import_times = [measure_import_time(modules[day], repeat)
+                    for day in days]
+    print_import_report(import_times, budget)
+    return budget is None or all(t.cumulative <= budget
+                                 for t in import_times)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip(),
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-d', '--days', nargs='+', type=int,
+                        help='days to run (default: all solved days)')
+    parser.add_argument('-p', '--parts', nargs='+', type=int, choices=PARTS,
+                        default=list(PARTS), help='parts to run')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='maximum number of worker processes '
+                             '(default: number of CPUs)')
+    parser.add_argument('-r', '--repeat', type=positive_int, default=1,
+                        help='number of timed runs of each part')
+    parser.add_argument('--warmup', type=non_negative_int, default=0,
+                        help='number of untimed runs of each part before '
+                             'the timed runs')
+    parser.add_argument('--no-gc', action='store_true',
+                        help='disable the garbage collector during each run')
+    parser.add_argument('--profile', choices=PROFILERS,
+                        help='profile one extra, untimed run of each part')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='load parsed data from $PARSE_CACHE_DIR_PATH '
+                             'when the data file and solver are unchanged')
+    parser.add_argument('--answer-cache', action='store_true',
+                        help='return answers from $ANSWER_CACHE_DIR_PATH '
+                             'when the data file and solver are unchanged')
+    parser.add_argument('--record', action='store_true',
+                        help='append the results to $RESULTS_FILE_PATH')
+    parser.add_argument('--importtime', action='store_true',
+                        help='report the time to import each day module in '
+                             'a fresh interpreter instead of solving')
+    parser.add_argument('--import-budget', type=float, metavar='MS',
+                        help='with --importtime, exit with status 1 when a '
+                             'day module takes longer than this many '
+                             'milliseconds to import')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.days:
+        days = [f'{day:02d}' for day in args.days]
+    else:
+        days = list(find_days())
+
+    if args.importtime:
+        budget = None
+        if args.import_budget is not None:
+            budget = args.import_budget / 1000
+        sys.exit(0 if check_import_times(days, args.repeat, budget) else 1)
+
+    timer = Timer()
+    results = run(days, args.parts, args.workers, args.repeat, args.warmup,
+                  args.no_gc, args.profile, args.parse_cache,
+                  args.answer_cache)
+    timer.stop()
+
+    print_report(results, timer, args.repeat)
+    if args.record:
+        record_results(results)
+
+
+if __name__ == "__main__":
+    main()
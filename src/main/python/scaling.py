@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Measure how solve times grow with the size of the puzzle data.
+
+Each selected day is solved on generated data of each selected size, and
+the median solve times are printed as a table. With --plot, they are also
+plotted on log-log axes, one line per day and part, so a quadratic hot path
+shows up as a steeper line.
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+
+from src.main.python.generate import GENERATORS, write
+from src.main.python.registry import find_days, load_solver
+from src.main.python.runner import PARTS, positive_int
+from src.main.python.util import Timer
+
+DEFAULT_SIZES = [10, 20, 40, 80]
+
+
+def measure(days: list[str], parts: list[int], sizes: list[int],
+            repeat: int = 3, seed: int = 0) -> dict[tuple, list[float]]:
+    """
+    Solve generated data of each size and collect the median solve times.
+
+    Args:
+        days: The days to measure, as two-digit strings.
+        parts: The parts to measure for each day.
+        sizes: The data sizes. What size means depends on the day.
+        repeat: The number of timed runs at each size.
+        seed: The random seed for the generated data.
+
+    Returns:
+        The median solve time in seconds at each size, keyed by day and part.
+    """
+    modules = find_days()
+    unknown = [day for day in days
+               if day not in modules or day not in GENERATORS]
+    if unknown:
+        raise RuntimeError(f'No generator for day(s): {", ".join(unknown)}')
+
+    times = {(day, part): [] for day in days for part in parts}
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            for size in sizes:
+                data_file_path = os.path.join(directory,
+                                              f'day{day}-{size}.data')
+                write(day, size, data_file_path, seed)
+                for part in parts:
+                    solver = load_solver(modules[day])
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = solver.benchmark(part, data_file_path,
+                                                  repeat, warmup=0)
+                    times[(day, part)].append(result.solve_stats.median)
+    return times
+
+
+def print_table(times: dict[tuple, list[float]], sizes: list[int]) -> None:
+    print(f'{"Day":>3}  {"Part":>4}  '
+          + ''.join(f'{size:>20}  ' for size in sizes))
+    for (day, part), medians in times.items():
+        print(f'{day:>3}  {part:>4}  '
+              + ''.join(f'{Timer.format_seconds(t):>20}  ' for t in medians))
+
+
+def plot(times: dict[tuple, list[float]], sizes: list[int],
+         path: str) -> None:
+    """
+    Plot median solve time against data size and save the figure.
+
+    Args:
+        times: The median solve times, keyed by day and part.
+        sizes: The data sizes.
+        path: The image file to write.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots()
+    for (day, part), medians in times.items():
+        axes.plot(sizes, medians, marker='o', label=f'Day {day} Part {part}')
+    axes.set_xscale('log')
+    axes.set_yscale('log')
+    axes.set_xlabel('Data Size')
+    axes.set_ylabel('Median Solve Time (s)')
+    axes.legend()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    figure.savefig(path)
+    plt.close(figure)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+            description=__doc__.strip(),
+            formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-d', '--days', nargs='+', type=int, required=True,
+                        help='days to measure')
+    parser.add_argument('-p', '--parts', nargs='+', type=int, choices=PARTS,
+                        default=list(PARTS), help='parts to measure')
+    parser.add_argument('-s', '--sizes', nargs='+', type=int,
+                        default=DEFAULT_SIZES,
+                        help='data sizes (default: '
+                             f'{" ".join(map(str, DEFAULT_SIZES))})')
+    parser.add_argument('-r', '--repeat', type=positive_int, default=3,
+                        help='number of timed runs at each size')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed for the generated data')
+    parser.add_argument('--plot', metavar='PATH',
+                        help='also plot the times to this image file')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    days = [f'{day:02d}' for day in args.days]
+    times = measure(days, args.parts, args.sizes, args.repeat, args.seed)
+    print_table(times, args.sizes)
+    if args.plot:
+        plot(times, args.sizes, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
+import copy
+import gc
+import mmap
 import os
 import time
 from abc import abstractmethod, ABC
-from typing import Any
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Iterator, TYPE_CHECKING
+
+# Every solver imports this module, so modules that only some runs need,
+# like statistics, hashlib and the profilers, are imported where they are
+# used instead of here.
+if TYPE_CHECKING:
+    from src.main.python.cache import AnswerCache, ParseCache
 
 
 class Timer:
@@ -22,19 +33,40 @@ class Timer:
         """
         self.end_time = time.perf_counter()
 
+    def elapsed_seconds(self) -> float:
+        """
+        Get the elapsed time in seconds.
+
+        Returns:
+            The number of seconds between starting and stopping this Timer.
+        """
+        if self.end_time is None:
+            self.stop()
+        return self.end_time - self.start_time
+
     def elapsed_time(self) -> str:
         """
         Format a string that represents the elapsed time.
 
-        Scale the elapsed time value to seconds, milliseconds, microseconds,
-        or nanoseconds based on the magnitude of the value.
-
         Returns:
             The string representation of the elapsed time for this Timer.
         """
-        if self.end_time is None:
-            self.stop()
-        t = self.end_time - self.start_time
+        return Timer.format_seconds(self.elapsed_seconds())
+
+    @staticmethod
+    def format_seconds(t: float) -> str:
+        """
+        Format a string that represents a number of seconds.
+
+        Scale the value to seconds, milliseconds, microseconds, or
+        nanoseconds based on its magnitude.
+
+        Args:
+            t: The number of seconds.
+
+        Returns:
+            The string representation of the number of seconds.
+        """
         unit = 'seconds'
         if t < 1:
             t = t * 1000
@@ -49,6 +81,133 @@ class Timer:
         return f'{t:.2f} {unit}'
 
 
+class ParsedData:
+    """
+    Puzzle data that was parsed once and is handed out as snapshots.
+
+    Some solvers mutate their parsed data, or the solver state set up by
+    init_data, while solving. Keeping a pristine copy lets each part start
+    from the same state without reading and parsing the data file again.
+    """
+
+    def __init__(self, data: Any, state: dict[str, Any], timer: Timer,
+                 data_file_path: str = None) -> None:
+        """
+        Create a new ParsedData.
+
+        Args:
+            data: The value returned by init_data.
+            state: The solver instance attributes right after init_data.
+            timer: The stopped Timer that measured init_data.
+            data_file_path: The path to the data file that was parsed.
+        """
+        self.data = data
+        self.state = state
+        self.timer = timer
+        self.data_file_path = data_file_path
+
+    def snapshot(self) -> tuple[Any, dict[str, Any]]:
+        """
+        Copy the parsed data and the solver state captured with it.
+
+        Both are copied together so references shared between them are
+        preserved in the copy.
+
+        Returns:
+            A deep copy of the parsed data and the solver state.
+        """
+        return copy.deepcopy((self.data, self.state))
+
+
+@dataclass
+class TimingStats:
+    """
+    Summary statistics, in seconds, of repeated timings of the same code.
+    """
+    count: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+
+    @staticmethod
+    def from_samples(samples: list[float]) -> 'TimingStats':
+        """
+        Summarize a list of timings.
+
+        Args:
+            samples: The timings, in seconds. There must be at least one.
+
+        Returns:
+            The statistics for the timings.
+        """
+        import statistics
+
+        if len(samples) > 1:
+            p95 = statistics.quantiles(samples, n=20, method='inclusive')[18]
+            stddev = statistics.stdev(samples)
+        else:
+            p95 = samples[0]
+            stddev = 0.0
+        return TimingStats(len(samples), min(samples),
+                           statistics.median(samples), p95, stddev)
+
+    def __str__(self) -> str:
+        return f'min {Timer.format_seconds(self.min)}, ' \
+               f'median {Timer.format_seconds(self.median)}, ' \
+               f'p95 {Timer.format_seconds(self.p95)}, ' \
+               f'stddev {Timer.format_seconds(self.stddev)}'
+
+
+@contextmanager
+def gc_paused(pause: bool = True) -> Iterator[None]:
+    """
+    Disable the garbage collector for the duration of a with block.
+
+    Args:
+        pause: Leave the garbage collector alone when False.
+    """
+    was_enabled = gc.isenabled()
+    if pause:
+        gc.collect()
+        gc.disable()
+    try:
+        yield
+    finally:
+        if pause and was_enabled:
+            gc.enable()
+
+
+@dataclass
+class PartResult:
+    """
+    The answer to one part of a puzzle and the time it took to get it.
+    """
+    day: str
+    part: int
+    answer: Any
+    parse_timer: Timer | None
+    solve_timer: Timer
+    profile: str = None
+    cached: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The answer to one part of a puzzle and statistics for repeated timings.
+    """
+    day: str
+    part: int
+    answer: Any
+    parse_stats: TimingStats | None
+    solve_stats: TimingStats
+    warmup: int
+    gc_disabled: bool
+    profile: str = None
+    cached: bool = False
+
+
 class AbstractSolver(ABC):
     def __init__(self) -> None:
         self.data = None
@@ -69,43 +228,287 @@ class AbstractSolver(ABC):
     def get_day(self):
         pass
 
-    def part_1(self, data_file_path: str = None) -> Any:
+    def get_parameters(self) -> dict[str, Any]:
+        """
+        Get the constructor arguments that change the answers.
+
+        Cached results are only reused for solvers with equal parameters.
+
+        Returns:
+            The parameter values, keyed by name.
+        """
+        return dict()
+
+    def parse(self, data_file_path: str = None,
+              cache: 'ParseCache' = None) -> ParsedData:
         timer = Timer()
-        answer = self.solve_part_1(self.init_data(data_file_path))
+        path = self.get_data_file_path(self.get_day(), data_file_path)
+        cache_key = None
+        cached = None
+        if cache is not None:
+            cache_key = cache.key(self, path)
+            cached = cache.get(cache_key)
+
+        if cached is None:
+            data = self.init_data(data_file_path)
+        else:
+            data, state = cached
+            vars(self).update(state)
         timer.stop()
 
-        self.print_info(part='Part 1', timer=timer, answer=answer)
+        if cache is not None and cached is None:
+            cache.put(cache_key, data, vars(self))
+
+        return ParsedData(data, dict(vars(self)), timer, path)
+
+    def restore(self, parsed: ParsedData) -> Any:
+        data, state = parsed.snapshot()
+        vars(self).update(state)
+        return data
 
-        return answer
+    def part_1(self, data_file_path: str = None, parsed: ParsedData = None,
+               profiler: str = None,
+               answer_cache: 'AnswerCache' = None) -> Any:
+        return self.solve_part(1, data_file_path, parsed, profiler,
+                               answer_cache)
 
-    def part_2(self, data_file_path: str = None) -> Any:
+    def part_2(self, data_file_path: str = None, parsed: ParsedData = None,
+               profiler: str = None,
+               answer_cache: 'AnswerCache' = None) -> Any:
+        return self.solve_part(2, data_file_path, parsed, profiler,
+                               answer_cache)
+
+    def solve_part(self, part: int, data_file_path: str = None,
+                   parsed: ParsedData = None, profiler: str = None,
+                   answer_cache: 'AnswerCache' = None) -> Any:
+        result = self.measure_part(part, data_file_path, parsed, profiler,
+                                   answer_cache=answer_cache)
+        self.print_info(part=f'Part {part}', timer=result.solve_timer,
+                        answer=result.answer, parse_timer=result.parse_timer,
+                        cached=result.cached)
+        if result.profile:
+            print(result.profile)
+
+        return result.answer
+
+    def measure_part(self, part: int, data_file_path: str = None,
+                     parsed: ParsedData = None, profiler: str = None,
+                     parse_cache: 'ParseCache' = None,
+                     answer_cache: 'AnswerCache' = None) -> PartResult:
+        answer_key = None
+        if answer_cache is not None:
+            answer_key, cached = self.lookup_answer(
+                    part, parsed.data_file_path if parsed else data_file_path,
+                    answer_cache)
+            if cached is not None:
+                return cached
+
+        if parsed is None:
+            parsed = self.parse(data_file_path, parse_cache)
+            data = parsed.data
+        else:
+            data = self.restore(parsed)
+        solve = self.solve_part_1 if part == 1 else self.solve_part_2
+
+        active_profiler = None
+        if profiler is not None:
+            from src.main.python.profiling import get_profiler
+            active_profiler = get_profiler(profiler,
+                                           f'day{self.get_day()}-part{part}')
+        with active_profiler or nullcontext():
+            timer = Timer()
+            answer = solve(data)
+            timer.stop()
+        profile = active_profiler.report() if active_profiler else None
+
+        if answer_cache is not None:
+            answer_cache.put(answer_key, answer)
+
+        return PartResult(self.get_day(), part, answer, parsed.timer, timer,
+                          profile)
+
+    def lookup_answer(self, part: int, data_file_path: str,
+                      answer_cache: 'AnswerCache'
+                      ) -> tuple[str, PartResult | None]:
+        """
+        Look up the answer to a part in an answer cache.
+
+        Args:
+            part: The puzzle part, 1 or 2.
+            data_file_path: The path to the data file. Defaults to the puzzle
+                data for the day.
+            answer_cache: The answer cache.
+
+        Returns:
+            The cache key, and the cached answer timed as a lookup, or None
+            on a miss.
+        """
         timer = Timer()
-        answer = self.solve_part_2(self.init_data(data_file_path))
+        path = self.get_data_file_path(self.get_day(), data_file_path)
+        key = answer_cache.key(self, part, path)
+        answer = answer_cache.get(key)
         timer.stop()
+        if answer is None:
+            return key, None
+        return key, PartResult(self.get_day(), part, answer, None, timer,
+                               cached=True)
 
-        self.print_info(part='Part 2', timer=timer, answer=answer)
+    def benchmark(self, part: int, data_file_path: str = None,
+                  repeat: int = 10, warmup: int = 1, disable_gc: bool = False,
+                  profiler: str = None, parse_cache: 'ParseCache' = None,
+                  answer_cache: 'AnswerCache' = None) -> BenchmarkResult:
+        self.check_runs(repeat, warmup)
+        # The cache is checked once, so the timings never mix real solves
+        # with cache lookups.
+        answer_key = None
+        if answer_cache is not None:
+            answer_key, cached = self.lookup_answer(part, data_file_path,
+                                                    answer_cache)
+            if cached is not None:
+                solve_time = cached.solve_timer.elapsed_seconds()
+                return BenchmarkResult(cached.day, part, cached.answer, None,
+                                       TimingStats.from_samples([solve_time]),
+                                       0, disable_gc, cached=True)
 
-        return answer
+        initial_state = copy.deepcopy(vars(self))
+        result = self.time_runs(part, data_file_path, repeat, warmup,
+                                disable_gc, parse_cache)
+
+        if profiler is not None:
+            # Profile one extra run so profiler overhead stays out of the
+            # timings.
+            vars(self).update(copy.deepcopy(initial_state))
+            result.profile = self.measure_part(part, data_file_path,
+                                               profiler=profiler,
+                                               parse_cache=parse_cache).profile
+
+        if answer_cache is not None:
+            answer_cache.put(answer_key, result.answer)
+        return result
+
+    @staticmethod
+    def check_runs(repeat: int, warmup: int) -> None:
+        # Fewer runs would leave no timed run, or silently drop some.
+        if repeat < 1:
+            raise RuntimeError(f'repeat must be at least 1: {repeat}')
+        if warmup < 0:
+            raise RuntimeError(f'warmup must be at least 0: {warmup}')
+
+    def time_runs(self, part: int, data_file_path: str, repeat: int,
+                  warmup: int, disable_gc: bool,
+                  parse_cache: 'ParseCache' = None) -> BenchmarkResult:
+        initial_state = copy.deepcopy(vars(self))
+        parse_times = []
+        solve_times = []
+        result = None
+        for i in range(warmup + repeat):
+            vars(self).update(copy.deepcopy(initial_state))
+            with gc_paused(disable_gc):
+                result = self.measure_part(part, data_file_path,
+                                           parse_cache=parse_cache)
+            if i >= warmup:
+                parse_times.append(result.parse_timer.elapsed_seconds())
+                solve_times.append(result.solve_timer.elapsed_seconds())
+
+        return BenchmarkResult(self.get_day(), part, result.answer,
+                               TimingStats.from_samples(parse_times),
+                               TimingStats.from_samples(solve_times),
+                               warmup, disable_gc)
 
     def run(self) -> None:
-        day = self.get_day()
-        data_file_path = os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
-                                      f'day{day}.data')
-        self.part_1(data_file_path)
-        self.part_2(data_file_path)
+        data_file_path = self.get_data_file_path(self.get_day())
+        parsed = self.parse(data_file_path)
+        self.part_1(parsed=parsed)
+        self.part_2(parsed=parsed)
 
     @staticmethod
-    def print_info(part: str, timer: Timer, answer: int) -> None:
+    def print_info(part: str, timer: Timer, answer: int,
+                   parse_timer: Timer = None, cached: bool = False) -> None:
+        parse_time = ''
+        if parse_timer is not None:
+            parse_time = f'      Parse Time: {parse_timer.elapsed_time()}\n'
         print(f'{part}\n'
+              f'{parse_time}'
               f'    Elapsed Time: {timer.elapsed_time()}\n'
-              f'          Answer: {answer}')
+              f'          Answer: {answer}{" (cached)" if cached else ""}')
 
     @staticmethod
-    def get_data(day: str, data_file_path: str = None) -> list[str]:
+    def print_benchmark(result: BenchmarkResult) -> None:
+        parse_time = ''
+        if result.parse_stats is not None:
+            parse_time = f'      Parse Time: {result.parse_stats}\n'
+        print(f'Part {result.part} ({result.solve_stats.count} runs after '
+              f'{result.warmup} warmup, '
+              f'GC {"disabled" if result.gc_disabled else "enabled"})\n'
+              f'{parse_time}'
+              f'    Elapsed Time: {result.solve_stats}\n'
+              f'          Answer: {result.answer}'
+              f'{" (cached)" if result.cached else ""}')
+        if result.profile:
+            print(result.profile)
+
+    @staticmethod
+    def get_data_file_path(day: str, data_file_path: str = None) -> str:
         if data_file_path:
-            path = data_file_path
-        else:
-            path = os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
-                                f'day{day}.data')
+            return data_file_path
+        return os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                            f'day{day}.data')
+
+    @staticmethod
+    def get_data(day: str, data_file_path: str = None) -> list[str]:
+        path = AbstractSolver.get_data_file_path(day, data_file_path)
         with open(path, 'r') as data_file:
             return data_file.read().splitlines()
+
+    @staticmethod
+    def iter_data(day: str, data_file_path: str = None,
+                  binary: bool = False) -> Iterator[str | bytes]:
+        """
+        Lazily iterate over the lines of a data file.
+
+        The file is memory-mapped and each line is copied out only when it
+        is reached, so memory use does not grow with the size of the file.
+        Lines are yielded without their line endings, as get_data returns
+        them.
+
+        Args:
+            day: The day of the puzzle.
+            data_file_path: The path to the data file. Defaults to the
+                puzzle data for the day.
+            binary: Yield each line as bytes instead of decoding it.
+
+        Returns:
+            An iterator over the lines of the file.
+        """
+        path = AbstractSolver.get_data_file_path(day, data_file_path)
+        with open(path, 'rb') as data_file:
+            if os.fstat(data_file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(data_file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as data:
+                start = 0
+                while start < len(data):
+                    end = data.find(b'\n', start)
+                    if end == -1:
+                        end = len(data)
+                    line = data[start:end]
+                    if line.endswith(b'\r'):
+                        line = line[:-1]
+                    yield line if binary else line.decode()
+                    start = end + 1
+
+
+def file_digest(path: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The hex SHA-256 digest of the file contents.
+    """
+    import hashlib
+
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
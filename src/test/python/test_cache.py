@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import os.path
+
+from src.main.python import day11
+from src.main.python.cache import AnswerCache, ParseCache, source_files
+from src.main.python.day15 import Solver
+
+
+def test_parse_cache(tmp_path):
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day11-example.data')
+    cache = ParseCache(str(tmp_path))
+    for _ in range(2):
+        solver = day11.Solver()
+        parsed = solver.parse(data_file_path, cache)
+        assert solver.part_1(parsed=parsed) == 10605
+        assert solver.part_2(parsed=parsed) == 2713310158
+    assert len(list(tmp_path.glob('*.pickle'))) == 1
+
+
+def test_parse_cache_evict(tmp_path):
+    cache = ParseCache(str(tmp_path))
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, bytes(1000), {})
+        os.utime(cache.get_path(key), (i, i))
+    cache.get('a')
+    cache.max_bytes = 2500
+    cache.evict()
+    assert [os.path.basename(path) for _, _, path in cache.entries()] == \
+        ['c.pickle', 'a.pickle']
+
+
+def test_answer_cache(tmp_path):
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day15-example.data')
+    cache = AnswerCache(str(tmp_path))
+    result = Solver(row=10).measure_part(1, data_file_path,
+                                         answer_cache=cache)
+    assert result.answer == 26 and not result.cached
+    result = Solver(row=10).measure_part(1, data_file_path,
+                                         answer_cache=cache)
+    assert result.answer == 26 and result.cached
+    result = Solver(row=11).measure_part(1, data_file_path,
+                                         answer_cache=cache)
+    assert not result.cached
+
+
+def test_answer_cache_evict(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, 'x' * 1000)
+        os.utime(cache.get_path(key), (i, i))
+    assert cache.get('a') == 'x' * 1000
+    cache.max_bytes = 2500
+    cache.put('d', 'x' * 1000)
+    assert [os.path.basename(path) for _, _, path in cache.entries()] == \
+        ['a.json', 'd.json']
+
+
+def test_benchmark_answer_cache(tmp_path):
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day15-example.data')
+    cache = AnswerCache(str(tmp_path))
+
+    # A miss times real solves only, then stores the answer once.
+    result = Solver(row=10).benchmark(1, data_file_path, repeat=3, warmup=1,
+                                      answer_cache=cache)
+    assert result.answer == 26 and not result.cached
+    assert result.parse_stats.count == result.solve_stats.count == 3
+    assert result.parse_stats.median > 0
+    assert len(os.listdir(tmp_path)) == 1
+
+    # A hit is one lookup with no parse.
+    result = Solver(row=10).benchmark(1, data_file_path, repeat=3, warmup=1,
+                                      answer_cache=cache)
+    assert result.answer == 26 and result.cached
+    assert result.parse_stats is None
+    assert result.solve_stats.count == 1
+
+
+def test_source_files():
+    names = [os.path.basename(path)
+             for path in source_files('src.main.python.day15')]
+    assert 'day15.py' in names
+    assert 'intervals.py' in names
+    assert 'util.py' in names
+    assert 'abc.py' not in names
+    assert 'intervals.py' not in [
+            os.path.basename(path)
+            for path in source_files('src.main.python.day01')]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+import json
+import os.path
+import shutil
+
+import pytest
+
+from src.main.python.crossbench import compile_java, run_java, to_result
+
+
+def test_java_record():
+    line = '{"day": "15", "part": 2, "answer": "56000011", ' \
+           '"implementation": "Java", "version": "21", "warmup": 3, ' \
+           '"parse": {"count": 2, "min": 1e-3, "median": 1.5e-3, ' \
+           '"p95": 1.95e-3, "stddev": 7.07e-4}, ' \
+           '"solve": {"count": 2, "min": 2e-6, "median": 3e-6, ' \
+           '"p95": 3.9e-6, "stddev": 1.41e-6}}'
+    result = to_result(json.loads(line))
+    assert (result.day, result.part, result.warmup) == ('15', 2, 3)
+    assert result.answer == str(56000011)
+    assert result.solve_stats.median == 3e-6
+
+
+@pytest.mark.skipif(shutil.which('javac') is None or
+                    shutil.which('java') is None, reason='needs a JDK')
+def test_run_java(tmp_path, monkeypatch):
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day15-example.data')
+    monkeypatch.setenv('JAVA_CLASS_DIR_PATH', str(tmp_path))
+    records = run_java(compile_java(), data_file_path, repeat=2, warmup=1,
+                       row=10, max_xy=20)
+    assert [(r['part'], r['answer']) for r in records] == \
+        [(1, '26'), (2, '56000011')]
+    assert all(r['solve']['count'] == 2 for r in records)
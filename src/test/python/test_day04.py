@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import os.path
 
+import pytest
+
 from src.main.python.day04 import Solver
 
 
@@ -37,3 +39,15 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 839
+
+
+@pytest.mark.parametrize('resources, name, answers', [
+    ('TEST_RESOURCES_DIR_PATH', f'day{day}-example.data', (2, 4)),
+    ('RESOURCES_DIR_PATH', f'day{day}.data', (560, 839)),
+])
+def test_columnar(resources, name, answers):
+    pytest.importorskip('numpy')
+    data_file_path = os.path.join(os.environ.get(resources), name)
+    solver = Solver(columnar=True)
+    assert solver.part_1(data_file_path) == answers[0]
+    assert solver.part_2(data_file_path) == answers[1]
@@ -2,6 +2,7 @@
 import os.path
 
 from src.main.python.day05 import Solver
+from src.main.python.generate import generate, write
 
 
 day = os.path.basename(__file__)[8:10]
@@ -37,3 +38,17 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 'VLCWHTDSZ'
+
+
+def test_generated(tmp_path):
+    data_file_path = str(tmp_path / f'day{day}.data')
+    write(day, 0, data_file_path, seed=3)
+    drawing = generate(day, 0, seed=3)[:-2]
+    tops = ''.join(next(line[i] for line in drawing if line[i].strip())
+                   for i in range(1, len(drawing[0]), 4))
+    solver = Solver()
+    assert solver.part_1(data_file_path) == tops
+
+    write(day, 500, data_file_path, seed=3)
+    solver = Solver()
+    assert solver.part_1(data_file_path).isalpha()
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import os.path
+import random
 
-from src.main.python.day06 import Solver
+import pytest
+
+from src.main.python.day06 import find_marker, read_chunks, Solver
+from src.main.python.generate import generate, write
 
 
 day = os.path.basename(__file__)[8:10]
@@ -101,3 +105,40 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 3534
+
+
+def brute_force_marker(datastream, size):
+    for i in range(size, len(datastream) + 1):
+        if len(set(datastream[i - size:i])) == size:
+            return i
+    return -1
+
+
+@pytest.mark.parametrize('size', [1, 2, 4, 7, 14, 27])
+def test_find_marker_window_sizes(size):
+    rng = random.Random(size)
+    for _ in range(50):
+        datastream = ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz',
+                                         k=rng.randint(0, 200)))
+        assert find_marker([datastream], size) == \
+            brute_force_marker(datastream, size)
+
+
+def test_find_marker_chunks():
+    datastream = generate(day, 10000)[0]
+    expected = brute_force_marker(datastream, 14)
+    assert expected != -1
+    for chunk_size in [1, 3, 14, 4096]:
+        chunks = [datastream[i:i + chunk_size]
+                  for i in range(0, len(datastream), chunk_size)]
+        assert find_marker(chunks, 14) == expected
+
+
+def test_read_chunks(tmp_path):
+    data_file_path = os.path.join(tmp_path, f'day{day}.data')
+    write(day, 10000, data_file_path)
+    datastream = generate(day, 10000)[0]
+    assert find_marker(read_chunks(data_file_path, 100), 4) == \
+        brute_force_marker(datastream, 4)
+    assert find_marker(read_chunks(data_file_path, 100), 14) == \
+        Solver().part_2(data_file_path)
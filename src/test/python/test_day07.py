@@ -2,6 +2,7 @@
 import os.path
 
 from src.main.python.day07 import Solver
+from src.main.python.generate import write
 
 day = os.path.basename(__file__)[8:10]
 
@@ -36,3 +37,14 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 8319096
+
+
+def test_part_2_generated(tmp_path):
+    data_file_path = str(tmp_path / f'day{day}.data')
+    for size in [1, 5, 200]:
+        write(day, size, data_file_path, seed=size)
+        solver = Solver()
+        answer = solver.part_2(data_file_path)
+        used_bytes = solver.root.size_bytes_recursive()
+        assert 40000000 < used_bytes < 70000000
+        assert used_bytes - 40000000 <= answer < used_bytes
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import os.path
 
-from src.main.python.day08 import Solver
+import pytest
+
+from src.main.python.day08 import Grove, Solver
+from src.main.python.generate import generate, write
 
 day = os.path.basename(__file__)[8:10]
 
@@ -36,3 +39,58 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 288120
+
+
+def test_generated(tmp_path):
+    assert generate(day, 50, seed=1) == generate(day, 50, seed=1)
+    assert generate(day, 50, seed=1) != generate(day, 50, seed=2)
+
+    data_file_path = str(tmp_path / f'day{day}.data')
+    write(day, 50, data_file_path, seed=1)
+    solver = Solver()
+    assert solver.part_1(data_file_path) >= 4 * 49
+
+
+def test_visibility_mask():
+    for seed in range(5):
+        grove = Grove(generate(day, 30, seed=seed))
+        mask = grove.visibility_mask()
+        assert mask == [[grove.is_tree_visible(row, col)
+                         for col in range(grove.cols)]
+                        for row in range(grove.rows)]
+
+
+def test_scenic_scores():
+    for seed in range(5):
+        grove = Grove(generate(day, 30, seed=seed))
+        assert grove.scenic_scores() == \
+            [[grove.get_scenic_score(row, col)
+              for col in range(grove.cols)]
+             for row in range(grove.rows)]
+
+
+def test_best_trees():
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    grove = Solver().init_data(data_file_path)
+    assert grove.best_trees(3) == [(16, 2, 0), (12, 4, 3), (12, 3, 4)]
+
+
+def test_as_array():
+    np = pytest.importorskip('numpy')
+    grove = Grove(['301', '255'])
+    heights = grove.as_array()
+    assert heights.shape == (2, 3)
+    assert heights.tolist() == [[3, 0, 1], [2, 5, 5]]
+    assert not heights.flags.writeable
+
+    # A vectorized kernel gives the same visibility as the sweeps.
+    grove = Grove(generate(day, 30, seed=1))
+    heights = grove.as_array().astype(np.int8)
+    visible = np.zeros(heights.shape, dtype=bool)
+    for k in range(4):
+        view = np.rot90(heights, k)
+        before = np.maximum.accumulate(view, axis=1)
+        before = np.pad(before[:, :-1], ((0, 0), (1, 0)), constant_values=-1)
+        visible |= np.rot90(view > before, -k)
+    assert visible.tolist() == grove.visibility_mask()
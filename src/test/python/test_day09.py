@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import os.path
 
-from src.main.python.day09 import Solver
+import pytest
+
+from src.main.python.day09 import Move, Rope, Solver
+from src.main.python.generate import generate
 
 day = os.path.basename(__file__)[8:10]
 
@@ -156,3 +159,47 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 2458
+
+
+def test_rope_one_knot():
+    rope = Rope(1)
+    rope.move(Move('R', 2))
+    rope.move(Move('U', 1))
+    assert rope.tail() == (2, 1)
+    assert rope.visited == {(0, 0), (1, 0), (2, 0), (2, 1)}
+
+
+def test_rope_without_tracking():
+    moves = Solver.parse_moves(generate(day, 100, seed=1))
+    rope = Rope(10, track_tail=False)
+    for move in moves:
+        rope.move(move)
+    assert rope.visited is None
+    assert rope.tail() == Solver.simulate(moves, 10).tail()
+
+
+def test_long_rope():
+    # The head never gets far enough away to pull the last knots.
+    moves = Solver.parse_moves(generate(day, 200, seed=1))
+    rope = Solver.simulate(moves, 5000)
+    assert len(rope) == 5000
+    assert rope.tail() == (0, 0)
+    assert rope.visited == {(0, 0)}
+    assert rope.xs[4000:] == rope.ys[4000:] == Rope(1000).xs
+
+
+def test_visited_counts():
+    data_file_path = os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                                  f'day{day}.data')
+    counts = Solver.visited_counts(Solver().init_data(data_file_path), 10)
+    assert counts[1] == 6271
+    assert counts[9] == 2458
+
+    moves = Solver.parse_moves(generate(day, 300, seed=2))
+    rope = Solver.simulate(moves, 12, track_all=True)
+    assert rope.visited is rope.visited_by_knot[-1]
+    assert rope.visited_counts() == \
+        [len(Solver.simulate(moves, k).visited) for k in range(1, 13)]
+
+    with pytest.raises(RuntimeError):
+        Rope(2).visited_counts()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os.path
 
-from src.main.python.day12 import Solver
+from src.main.python.day12 import Solver, WALL
 
 day = os.path.basename(__file__)[8:10]
 
@@ -36,3 +36,29 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 375
+
+
+def test_shortest_path():
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    height_map = Solver().parse(data_file_path).data
+    path = height_map.bfs([height_map.start]).path_to(height_map.end)
+    assert len(path) == 32
+    assert path[0] == height_map.start
+    assert path[-1] == height_map.end
+    for a, b in zip(path, path[1:]):
+        assert b in height_map.neighbors(a)
+        assert height_map.heights[b] <= height_map.heights[a] + 1
+
+
+def test_reverse_search():
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    height_map = Solver().parse(data_file_path).data
+    to_end = height_map.bfs([height_map.end], reverse=True)
+    assert to_end.distances[height_map.start] == 31
+    for cell in range(len(height_map.heights)):
+        if height_map.heights[cell] == WALL:
+            continue
+        forward = height_map.bfs([cell]).distances[height_map.end]
+        assert to_end.distances[cell] == forward
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import os.path
+import tracemalloc
 
-from src.main.python.day15 import Solver
+import pytest
+
+from src.main.python.day15 import Point, RowCoverage, Solver
+from src.main.python.generate import write
 
 day = os.path.basename(__file__)[8:10]
 
@@ -36,3 +40,93 @@ def test_part_2():
     solver = Solver()
     answer = solver.part_2(data_file_path)
     assert answer == 12567351400528
+
+
+def test_part_1_beacons_on_row():
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    for row in range(-5, 30):
+        solver = Solver(row=row)
+        sensors = solver.init_data(data_file_path)
+        beacons = set(solver.beacon_points)
+        expected = sum(1 for x in range(-20, 50)
+                       if Point(x, row) not in beacons
+                       and any(s.is_in_exclusion_zone(Point(x, row))
+                               for s in sensors))
+        assert solver.solve_part_1(sensors) == expected
+
+
+def test_part_2_corner(tmp_path):
+    data_file_path = str(tmp_path / f'day{day}.data')
+    with open(data_file_path, 'w') as data_file:
+        data_file.write('Sensor at x=20, y=20: closest beacon is at x=1, '
+                        'y=0\n')
+    solver = Solver(max_xy=20)
+    assert solver.part_2(data_file_path) == 0
+
+
+def test_part_2_generated(tmp_path):
+    data_file_path = str(tmp_path / f'day{day}.data')
+    write(day, 30, data_file_path, seed=7)
+    solver = Solver()
+    answer = solver.part_2(data_file_path)
+    x, y = divmod(answer, 4000000)
+    sensors = solver.parse(data_file_path).data
+    assert 0 <= x <= 4000000 and 0 <= y <= 4000000
+    assert all(s.taxi_distance(Point(x, y)) > s.beacon_distance()
+               for s in sensors)
+
+
+def test_row_queries_use_constant_memory():
+    data_file_path = os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                                  f'day{day}.data')
+    sensors = Solver().parse(data_file_path).data
+    tracemalloc.start()
+    try:
+        for y in range(0, 4000000, 2000):
+            for sensor in sensors:
+                sensor.excluded_x_interval(y)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert current < 64 * 1024
+
+
+def test_row_coverage_lengths():
+    pytest.importorskip('numpy')
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    solver = Solver()
+    sensors = solver.parse(data_file_path).data
+    rows = list(range(-15, 40))
+    lengths = RowCoverage(sensors).lengths(rows)
+    for y, length in zip(rows, lengths):
+        intervals = [i for i in (s.excluded_x_interval(y) for s in sensors)
+                     if i is not None]
+        assert length == sum(b - a + 1
+                             for a, b in solver.collapse_intervals(intervals))
+
+
+def test_row_coverage_first_gaps():
+    pytest.importorskip('numpy')
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  f'day{day}-example.data')
+    sensors = Solver().parse(data_file_path).data
+    gaps = RowCoverage(sensors).first_gaps(range(21), 0, 20)
+    assert [(y, x) for y, x in enumerate(gaps) if x >= 0] == [(11, 14)]
+    assert list(RowCoverage(sensors).lengths([11], 0, 20)) == [20]
+
+
+def test_row_coverage_chunks(tmp_path):
+    pytest.importorskip('numpy')
+    data_file_path = str(tmp_path / f'day{day}.data')
+    write(day, 200, data_file_path)
+    coverage = RowCoverage(Solver().parse(data_file_path).data)
+    assert coverage.chunk_rows * 200 * coverage.VALUES_PER_CELL * 8 <= \
+        coverage.CHUNK_BYTES
+    rows = range(0, 4000000, 40000)
+    lengths = coverage.lengths(rows)
+    gaps = coverage.first_gaps(rows, 0, 4000000)
+    coverage.chunk_rows = 7
+    assert list(coverage.lengths(rows)) == list(lengths)
+    assert list(coverage.first_gaps(rows, 0, 4000000)) == list(gaps)
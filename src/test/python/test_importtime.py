@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+from src.main.python.importtime import parse_import_time
+
+
+def test_parse_import_time():
+    output = """import time: self [us] | cumulative | imported package
+import time:       800 |        800 | site
+import time:       300 |        300 |     re
+import time:      1000 |       1300 |   src.main.python.util
+import time:       200 |       1500 | src.main.python.day02
+"""
+    import_time = parse_import_time('src.main.python.day02', output, top=2)
+    assert import_time.cumulative == 0.0015
+    assert import_time.slowest == [('src.main.python.util', 0.001),
+                                   ('re', 0.0003)]
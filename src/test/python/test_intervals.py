@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+import random
+
+from src.main.python.intervals import Interval, IntervalSet
+
+
+def test_interval_set():
+    intervals = IntervalSet([(10, 12), (1, 3)])
+    intervals.add(4, 5)
+    intervals.add(20, 25)
+    intervals.add(11, 21)
+    assert list(intervals) == [Interval(1, 5), Interval(10, 25)]
+    assert intervals.coverage() == 21
+    assert 5 in intervals and 6 not in intervals
+    assert intervals.covers(12, 20) and not intervals.covers(4, 10)
+    assert intervals.overlaps(6, 10) and not intervals.overlaps(6, 9)
+    assert list(intervals.gaps(0, 30)) == [Interval(0, 0), Interval(6, 9),
+                                           Interval(26, 30)]
+
+
+def test_interval_set_matches_python_set():
+    rng = random.Random(4)
+    intervals = IntervalSet()
+    values = set()
+    for _ in range(200):
+        low = rng.randint(0, 300)
+        high = low + rng.randint(0, 10)
+        intervals.add(low, high)
+        values.update(range(low, high + 1))
+    assert intervals.coverage() == len(values)
+    assert all((v in intervals) == (v in values) for v in range(-5, 320))
+    missing = [v for gap in intervals.gaps(-5, 320)
+               for v in range(gap.low, gap.high + 1)]
+    assert missing == [v for v in range(-5, 321) if v not in values]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+import os.path
+import time
+
+import pytest
+
+from src.main.python.profiling import get_profiler
+
+
+def busy(seconds):
+    values = []
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        values.append(sum(range(100)))
+    return values
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('PROFILE_DIR_PATH', str(tmp_path))
+    return tmp_path
+
+
+def test_cprofile(profile_dir):
+    with get_profiler('cprofile', 'test-cprofile') as profiler:
+        busy(0.01)
+    report = profiler.report()
+    path = os.path.join(profile_dir, 'test-cprofile.pstats')
+    assert report.startswith(f'Profile written to {path}\n')
+    assert 'busy' in report
+    assert os.path.exists(path)
+
+
+def test_tracemalloc():
+    with get_profiler('tracemalloc', 'test-tracemalloc') as profiler:
+        values = [bytes(1024) for _ in range(100)]
+    lines = profiler.report().splitlines()
+    assert lines[0].startswith('Peak Memory: ')
+    assert float(lines[0].split()[2]) >= 100
+    assert lines[1] == 'Top 10 allocation sites:'
+    assert 'test_profiling.py' in lines[2]
+    assert len(values) == 100
+
+
+def test_sampling(profile_dir):
+    with get_profiler('sampling', 'test-sampling') as profiler:
+        busy(0.1)
+    lines = profiler.report().splitlines()
+    path = os.path.join(profile_dir, 'test-sampling.collapsed')
+    assert lines[0].endswith(f' samples written to {path}')
+    assert int(lines[0].split()[0]) > 0
+    assert lines[1] == 'Top 10 functions by samples:'
+    assert any('busy (test_profiling.py' in line for line in lines[2:])
+    with open(path) as collapsed_file:
+        for line in collapsed_file:
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0
+
+
+def test_unknown_profiler():
+    with pytest.raises(RuntimeError):
+        get_profiler('perf', 'test')
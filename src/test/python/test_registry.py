@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+from src.main.python.day02 import Solver
+from src.main.python.registry import find_days, load_solver
+
+
+def test_registry():
+    days = find_days()
+    assert days['02'] == 'src.main.python.day02'
+    assert 'xx' not in days
+    solver = load_solver(days['02'])
+    assert isinstance(solver, Solver)
+    assert solver.get_day() == '02'
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+import os.path
+import sys
+
+import pytest
+
+from src.main.python import results
+from src.main.python.results import Comparison, append_records, compare, \
+    git_commit, latest_by_part, load_records, make_record
+from src.main.python.util import BenchmarkResult, TimingStats
+
+
+def make_stats(median):
+    return {'count': 1, 'min': median, 'median': median, 'p95': median,
+            'stddev': 0.0}
+
+
+def make_test_record(commit, day, part, median, input_sha256='abc',
+                     version='3.11.7'):
+    return {'timestamp': '2026-01-01T00:00:00+00:00', 'day': day,
+            'part': part, 'commit': commit, 'implementation': 'CPython',
+            'version': version, 'input_sha256': input_sha256, 'warmup': 0,
+            'gc_disabled': False, 'parse': make_stats(0.001),
+            'solve': make_stats(median)}
+
+
+RECORDS = [
+    make_test_record('base', '01', 1, 0.010),
+    make_test_record('base', '01', 2, 0.020),
+    make_test_record('base', '02', 1, 0.030),
+    make_test_record('base', '01', 1, 0.012),
+    make_test_record('head', '01', 1, 0.012),
+    make_test_record('head', '01', 2, 0.030),
+    make_test_record('head', '02', 1, 0.030, input_sha256='other'),
+    make_test_record('head', '01', 1, 0.040, version='3.12.0'),
+]
+
+
+def test_latest_by_part():
+    latest = latest_by_part(RECORDS, 'base')
+    assert len(latest) == 3
+    assert latest[('01', 1, 'abc', 'CPython', '3.11.7')]['solve'][
+               'median'] == 0.012
+
+
+def test_compare():
+    # Different input data and Python versions are not comparable.
+    assert compare(RECORDS, 'base', 'head') == [
+            Comparison('01', 1, 0.012, 0.012),
+            Comparison('01', 2, 0.020, 0.030)]
+    assert compare(RECORDS, 'base', 'missing') == []
+
+
+def test_is_regression():
+    assert not Comparison('01', 1, 0.012, 0.012).is_regression(0.1)
+    assert Comparison('01', 2, 0.020, 0.030).is_regression(0.1)
+    assert not Comparison('01', 2, 0.020, 0.030).is_regression(0.6)
+    assert not Comparison('01', 1, 0.0, 0.030).is_regression(0.1)
+
+
+def test_git_commit(tmp_path, monkeypatch):
+    # Git runs in the source directory, whatever the working directory.
+    monkeypatch.chdir(tmp_path)
+    commit = git_commit()
+    assert len(commit) == 40
+    assert git_commit(commit[:10]) == commit
+    with pytest.raises(RuntimeError):
+        git_commit('no-such-ref')
+
+
+@pytest.mark.parametrize('candidate, threshold, code', [
+    ('HEAD', '0.1', 1),
+    ('HEAD', '0.6', None),
+    ('HEAD~2', '0.1', 2),
+    ('no-such-ref', '0.1', 2),
+])
+def test_main_exit_code(tmp_path, monkeypatch, capsys, candidate, threshold,
+                        code):
+    commits = {'base': git_commit('HEAD~1'), 'head': git_commit('HEAD')}
+    results_file_path = str(tmp_path / 'results.jsonl')
+    append_records([dict(record, commit=commits[record['commit']])
+                    for record in RECORDS], results_file_path)
+    monkeypatch.setattr(sys, 'argv', ['results.py', 'HEAD~1', '-c',
+                                      candidate, '-t', threshold, '-f',
+                                      results_file_path])
+    if code is None:
+        results.main()
+    else:
+        with pytest.raises(SystemExit) as e:
+            results.main()
+        assert e.value.code == code
+    assert ('REGRESSION' in capsys.readouterr().out) == (code == 1)
+
+
+def test_records_round_trip(tmp_path):
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day01-example.data')
+    stats = TimingStats(3, 0.001, 0.002, 0.003, 0.0005)
+    result = BenchmarkResult('01', 1, 24000, stats, stats, 1, True)
+    record = make_record(result, data_file_path, 'abc123')
+    assert record['solve'] == {'count': 3, 'min': 0.001, 'median': 0.002,
+                               'p95': 0.003, 'stddev': 0.0005}
+    assert record['gc_disabled']
+
+    results_file_path = str(tmp_path / 'results' / 'results.jsonl')
+    assert load_records(results_file_path) == []
+    append_records([record], results_file_path)
+    append_records([record], results_file_path)
+    assert load_records(results_file_path) == [record, record]
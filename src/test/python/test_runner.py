@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import argparse
+import os.path
+import shutil
+
+import pytest
+
+from src.main.python.runner import get_modules, non_negative_int, \
+    positive_int, print_report, run
+from src.main.python.util import BenchmarkResult, TimingStats, Timer
+
+
+def test_get_modules():
+    assert get_modules(['02', '01']) == {'02': 'src.main.python.day02',
+                                         '01': 'src.main.python.day01'}
+    with pytest.raises(RuntimeError):
+        get_modules(['01', '99'])
+
+
+def test_positive_int():
+    assert positive_int('3') == 3
+    for value in ['0', '-1']:
+        with pytest.raises(argparse.ArgumentTypeError):
+            positive_int(value)
+    assert non_negative_int('0') == 0
+    with pytest.raises(argparse.ArgumentTypeError):
+        non_negative_int('-1')
+
+
+def test_run_with_failing_day(tmp_path, monkeypatch, capsys):
+    # Day 2 has no data file, so it fails while day 1 is still solved.
+    shutil.copy(os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                             'day01.data'), tmp_path)
+    monkeypatch.setenv('RESOURCES_DIR_PATH', str(tmp_path))
+    results = run(['02', '01'], [1, 2], workers=2, repeat=2)
+
+    assert [(r.day, r.part) for r in results] == \
+        [('01', 1), ('01', 2), ('02', 1), ('02', 2)]
+    assert [r.answer for r in results[:2]] == [69289, 205615]
+    assert all(r.solve_stats.count == 2 for r in results[:2])
+    for result in results[2:]:
+        assert isinstance(result.answer, FileNotFoundError)
+        assert result.parse_stats is None and result.solve_stats is None
+
+    print_report(results, Timer(), repeat=2)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ['Day', 'Part', 'Parse', 'Time', 'Solve',
+                                'Time', 'Solve', 'p95', 'Solve', 'StdDev',
+                                'Answer']
+    assert lines[1].endswith('  69289')
+    assert lines[3].split()[:4] == ['02', '1', '-', '-']
+    assert 'Failed: FileNotFoundError' in lines[3]
+    assert lines[-1].startswith('Wall-Clock Time: ')
+
+
+def test_print_report_cached(capsys):
+    stats = TimingStats(1, 0.001, 0.001, 0.001, 0.0)
+    results = [BenchmarkResult('04', 1, 'line 1\nline 2', None, stats, 0,
+                               False, cached=True)]
+    print_report(results, Timer())
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines[0].split()) == 7
+    assert lines[1].split() == ['04', '1', '-', '1.00', 'milliseconds']
+    assert lines[2:4] == ['line 1', 'line 2 (cached)']
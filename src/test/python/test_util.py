@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+import os.path
+
+import pytest
+
+from src.main.python import day01, day05
+
+
+def test_benchmark():
+    data_file_path = os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                                  'day01-example.data')
+    solver = day01.Solver()
+    result = solver.benchmark(1, data_file_path, repeat=5, warmup=2,
+                              disable_gc=True)
+    assert result.answer == 24000
+    assert result.solve_stats.count == 5
+    assert result.solve_stats.min <= result.solve_stats.median <= \
+        result.solve_stats.p95
+    with pytest.raises(RuntimeError):
+        solver.benchmark(1, data_file_path, repeat=0)
+    with pytest.raises(RuntimeError):
+        solver.benchmark(1, data_file_path, repeat=3, warmup=-1)
+
+
+def test_iter_data():
+    for data_file_path in [
+            os.path.join(os.environ.get('TEST_RESOURCES_DIR_PATH'),
+                         'day01-example.data'),
+            os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                         'day01.data')]:
+        assert list(day01.Solver.iter_data('01', data_file_path)) == \
+            day01.Solver.get_data('01', data_file_path)
+
+
+def test_parse_once():
+    data_file_path = os.path.join(os.environ.get('RESOURCES_DIR_PATH'),
+                                  'day05.data')
+    solver = day05.Solver()
+    parsed = solver.parse(data_file_path)
+    assert solver.part_1(parsed=parsed) == 'TBVFVDZPN'
+    assert solver.part_2(parsed=parsed) == 'VLCWHTDSZ'
+    assert solver.part_1(parsed=parsed) == 'TBVFVDZPN'